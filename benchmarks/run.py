@@ -0,0 +1,238 @@
+"""Benchmarks for figure construction, serialisation and payload size.
+
+Run from the repository root::
+
+    python benchmarks/run.py --save benchmarks/results/main.json
+    python benchmarks/run.py --compare benchmarks/results/main.json
+
+Timings are the best of ``--repeat`` runs. ``--compare`` exits non-zero when
+any timing is slower than the baseline by more than ``--tolerance``.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import plotly
+import plotly.graph_objects as go
+
+from soccer_viz import Pitch
+
+Builder = Callable[[Pitch, int, np.random.Generator], None]
+
+
+def _add_point(pitch: Pitch, n: int, rng: np.random.Generator) -> None:
+    for x, y in rng.uniform(0, 100, (n, 2)):
+        pitch.add_point(x, y)
+
+
+def _add_points(pitch: Pitch, n: int, rng: np.random.Generator) -> None:
+    xy = rng.uniform(0, 100, (n, 2))
+    pitch.add_points(xy[:, 0], xy[:, 1])
+
+
+def _add_line(pitch: Pitch, n: int, rng: np.random.Generator) -> None:
+    for x0, y0, x1, y1 in rng.uniform(0, 100, (n, 4)):
+        pitch.add_line(x0, y0, x1, y1)
+
+
+def _add_lines(pitch: Pitch, n: int, rng: np.random.Generator) -> None:
+    pitch.add_lines(*rng.uniform(0, 100, (4, n)))
+
+
+def _add_gradient_line(pitch: Pitch, n: int, rng: np.random.Generator) -> None:
+    for x0, y0, x1, y1 in rng.uniform(0, 100, (n, 4)):
+        pitch.add_gradient_line(x0, y0, x1, y1)
+
+
+def _add_annotation(pitch: Pitch, n: int, rng: np.random.Generator) -> None:
+    for x0, y0, x1, y1 in rng.uniform(0, 100, (n, 4)):
+        pitch.add_annotation(x0, y0, x1, y1)
+
+
+def _add_arrows(pitch: Pitch, n: int, rng: np.random.Generator) -> None:
+    pitch.add_arrows(*rng.uniform(0, 100, (4, n)))
+
+
+BUILDERS: dict[str, Builder] = {
+    "add_point": _add_point,
+    "add_points": _add_points,
+    "add_line": _add_line,
+    "add_lines": _add_lines,
+    "add_gradient_line": _add_gradient_line,
+    "add_annotation": _add_annotation,
+    "add_arrows": _add_arrows,
+}
+
+
+def _best_of(repeat: int, func: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _build(builder: Builder, n: int) -> Pitch:
+    pitch = Pitch()
+    builder(pitch, n, np.random.default_rng(0))
+    return pitch
+
+
+def _import_time(repeat: int) -> float:
+    code = (
+        "import time; start = time.perf_counter(); import soccer_viz; "
+        "print(time.perf_counter() - start)"
+    )
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(repeat)
+    )
+
+
+def _html_size(pitch: Pitch) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "pitch.html"
+        pitch.write_html(path)
+        return path.stat().st_size
+
+
+def run(
+    sizes: list[int],
+    render_limit: int,
+    repeat: int,
+    cases: list[str],
+) -> dict[str, Any]:
+    # show() is timed up to the point where plotly hands the figure to a
+    # renderer, so no browser or notebook is needed.
+    go.Figure.show = lambda self, *args, **kwargs: None
+
+    results: dict[str, float | int] = {"import": _import_time(repeat)}
+    for name in cases:
+        builder = BUILDERS[name]
+        for n in sizes:
+            prefix = f"{name}[{n}]"
+            print(prefix, file=sys.stderr, flush=True)
+            results[f"{prefix}.build"] = _best_of(
+                repeat, lambda: _build(builder, n)
+            )
+            if n > render_limit:
+                continue
+
+            pitch = _build(builder, n)
+            results[f"{prefix}.to_dict"] = _best_of(repeat, pitch.to_dict)
+            results[f"{prefix}.to_json"] = _best_of(repeat, pitch.to_json)
+            results[f"{prefix}.to_svg"] = _best_of(repeat, pitch.to_svg)
+            results[f"{prefix}.json_bytes"] = len(pitch.to_json().encode())
+            results[f"{prefix}.html_bytes"] = _html_size(pitch)
+            # Each show() gets a fresh pitch, otherwise later repeats
+            # would only measure the incremental path.
+            pitches = [_build(builder, n) for _ in range(repeat)]
+            results[f"{prefix}.show"] = _best_of(
+                repeat, lambda: pitches.pop().show()
+            )
+            results[f"{prefix}.show_again"] = _best_of(repeat, pitch.show)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "plotly": plotly.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "commit": _commit(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], tolerance: float
+) -> list[str]:
+    regressions = []
+    old, new = baseline["results"], current["results"]
+    print(f"{'benchmark':<40}{'baseline':>14}{'current':>14}{'ratio':>9}")
+    for key in sorted(old.keys() & new.keys()):
+        ratio = new[key] / old[key] if old[key] else float("inf")
+        flag = ""
+        # Sizes are deterministic, so any growth is reported.
+        limit = 1.0 if key.endswith("_bytes") else 1 + tolerance
+        if ratio > limit:
+            flag = " !"
+            regressions.append(key)
+        print(
+            f"{key:<40}{old[key]:>14.6g}{new[key]:>14.6g}{ratio:>9.2f}{flag}"
+        )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 1_000, 10_000, 100_000],
+    )
+    parser.add_argument(
+        "--render-limit",
+        type=int,
+        default=10_000,
+        help="largest size for which show() and serialisation are timed",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--cases", nargs="+", choices=list(BUILDERS), default=list(BUILDERS)
+    )
+    parser.add_argument("--save", type=Path)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    current = run(args.sizes, args.render_limit, args.repeat, args.cases)
+    if args.save is not None:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(current, indent=2) + "\n")
+    if args.compare is None:
+        json.dump(current, sys.stdout, indent=2)
+        print()
+        return 0
+
+    baseline = json.loads(args.compare.read_text())
+    regressions = compare(baseline, current, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s).", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,27 @@
-from ._models import PitchCoordinates, PitchMarkings
+from ._batch import PitchSpec, RenderResult, render_many
+from ._grid import PitchGrid
+from ._live import LiveEvent, LivePitch
+from ._models import PROVIDERS, REGIONS, PitchCoordinates, PitchMarkings
+from ._pitch_control import PitchControl
+from ._stats import PitchStats, StatsHook, Timing
 from ._visualization import DefaultTheme, Pitch, Theme
 
 __all__ = (
+    "PROVIDERS",
+    "REGIONS",
     "PitchCoordinates",
     "PitchMarkings",
+    "PitchControl",
     "Pitch",
+    "PitchGrid",
+    "PitchStats",
+    "StatsHook",
+    "Timing",
+    "PitchSpec",
+    "RenderResult",
+    "render_many",
+    "LiveEvent",
+    "LivePitch",
     "DefaultTheme",
     "Theme",
 )
\ No newline at end of file
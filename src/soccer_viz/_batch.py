@@ -0,0 +1,276 @@
+import os
+import pickle
+from collections.abc import Iterator, Sequence
+from math import ceil
+from pathlib import Path
+from typing import Any, Literal, TypedDict
+
+from ._visualization import Pitch
+
+Format = Literal["svg", "json", "html"]
+
+
+class PitchSpec(TypedDict, total=False):
+    # Keyword arguments for Pitch, then the layers to add as (method name,
+    # keyword arguments) pairs, e.g. ("add_points", {"x": [...], ...}).
+    # With a path the output is written there by the worker instead of
+    # being sent back.
+    pitch: dict[str, Any]
+    layers: list[tuple[str, dict[str, Any]]]
+    path: str | Path
+
+
+class RenderResult(TypedDict):
+    index: int
+    output: str | None
+    error: str | None
+
+
+def _build(spec: PitchSpec) -> Pitch:
+    pitch = Pitch(**spec.get("pitch", {}))
+    for name, kwargs in spec.get("layers", []):
+        if not name.startswith("add_") or not hasattr(pitch, name):
+            raise ValueError(f"Invalid layer: {name!r}. Expected an add_*.")
+        getattr(pitch, name)(**kwargs)
+    return pitch
+
+
+def _render(
+    spec: PitchSpec,
+    format: Format,
+    fig_length: int | float | None,
+    fig_width: int | float | None,
+) -> str:
+    pitch = _build(spec)
+    if format == "svg":
+        output = pitch.to_svg(fig_length, fig_width)
+    elif format == "json":
+        output = pitch.to_json(fig_length, fig_width)
+    else:
+        import plotly.io as pio
+
+        output = pio.to_html(
+            pitch.to_dict(fig_length, fig_width),
+            validate=False,
+            include_plotlyjs="cdn",
+        )
+    path = spec.get("path")
+    if path is None:
+        return output
+    Path(path).write_text(output, encoding="utf-8")
+    return str(path)
+
+
+def _render_chunk(
+    chunk: list[tuple[int, PitchSpec]],
+    format: Format,
+    fig_length: int | float | None,
+    fig_width: int | float | None,
+) -> list[RenderResult]:
+    results = []
+    for index, spec in chunk:
+        try:
+            output = _render(spec, format, fig_length, fig_width)
+        except Exception as e:
+            # Exceptions may not survive pickling, so only their message
+            # is sent back.
+            results.append(
+                RenderResult(
+                    index=index, output=None, error=f"{type(e).__name__}: {e}"
+                )
+            )
+        else:
+            results.append(
+                RenderResult(index=index, output=output, error=None)
+            )
+    return results
+
+
+def _warm(
+    pitches: list[dict[str, Any]], images: list[str], format: Format
+) -> None:
+    # Runs once in each worker. Backgrounds, encoded images and, for
+    # plotly output, the import and theme template are cached at module
+    # level, so every spec the worker renders afterwards reuses them.
+    for kwargs in pitches:
+        try:
+            pitch = Pitch(**kwargs)
+            pitch._background_shapes()
+            if format != "svg":
+                pitch._template()
+        except Exception:
+            # An invalid spec reports its error when it is rendered.
+            continue
+    for image in images:
+        try:
+            Pitch()._file_to_data_uri(image)
+        except OSError:
+            continue
+
+
+def _warm_up_key(kwargs: dict[str, Any]) -> tuple[Any, ...]:
+    # What the warm-up caches depend on: the background key of Pitch and
+    # the theme colours of the template.
+    theme = kwargs.get("theme")
+    colours = (
+        None
+        if theme is None
+        else (
+            theme.border,
+            theme.background,
+            theme.text,
+            theme.home_team,
+            theme.line,
+        )
+    )
+    return (
+        kwargs.get("markings"),
+        kwargs.get("vertical"),
+        kwargs.get("side"),
+        colours,
+    )
+
+
+def _warm_up_args(
+    specs: Sequence[PitchSpec],
+) -> tuple[list[dict[str, Any]], list[str]]:
+    # Specs often share a few backgrounds, so only one pitch per background
+    # is sent to each worker.
+    pitches: dict[tuple[Any, ...], dict[str, Any]] = {}
+    images: dict[str, None] = {}
+    for spec in specs:
+        kwargs = spec.get("pitch", {})
+        try:
+            key = _warm_up_key(kwargs)
+            if key not in pitches:
+                pickle.dumps(kwargs)
+                pitches[key] = kwargs
+        except Exception:
+            # An invalid spec reports its error when it is rendered.
+            pass
+        for _, layer in spec.get("layers", []):
+            image = layer.get("image_path")
+            if image is not None:
+                images[str(image)] = None
+    return list(pitches.values()), list(images)
+
+
+def render_many(
+    specs: Sequence[PitchSpec],
+    *,
+    format: Format = "svg",
+    workers: int | None = None,
+    chunksize: int | None = None,
+    fig_length: int | float | None = None,
+    fig_width: int | float | None = None,
+) -> Iterator[RenderResult]:
+    if format not in ("svg", "json", "html"):
+        raise ValueError(
+            f"Invalid format: {format}. Expected 'svg', 'json' or 'html'."
+        )
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"Invalid workers: {workers}. Expected >= 1.")
+    if chunksize is None:
+        chunksize = max(1, ceil(len(specs) / (workers * 4)))
+    if chunksize < 1:
+        raise ValueError(f"Invalid chunksize: {chunksize}. Expected >= 1.")
+    return _results(
+        list(enumerate(specs)),
+        format,
+        workers,
+        chunksize,
+        fig_length,
+        fig_width,
+    )
+
+
+def _chunks(
+    items: list[tuple[int, PitchSpec]], chunksize: int
+) -> list[list[tuple[int, PitchSpec]]]:
+    return [items[i : i + chunksize] for i in range(0, len(items), chunksize)]
+
+
+def _errors(
+    chunk: list[tuple[int, PitchSpec]], error: Exception
+) -> list[RenderResult]:
+    message = f"{type(error).__name__}: {error}"
+    return [
+        RenderResult(index=index, output=None, error=message)
+        for index, _ in chunk
+    ]
+
+
+def _results(
+    items: list[tuple[int, PitchSpec]],
+    format: Format,
+    workers: int,
+    chunksize: int,
+    fig_length: int | float | None,
+    fig_width: int | float | None,
+) -> Iterator[RenderResult]:
+    # Results are yielded as their chunk finishes, so they come back out
+    # of order; each carries the index of its spec.
+    if workers == 1 or len(items) <= chunksize:
+        for chunk in _chunks(items, chunksize):
+            yield from _render_chunk(chunk, format, fig_length, fig_width)
+        return
+
+    chunks = _chunks(items, chunksize)
+
+    from concurrent.futures import (
+        FIRST_COMPLETED,
+        BrokenExecutor,
+        ProcessPoolExecutor,
+        wait,
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        initializer=_warm,
+        initargs=(*_warm_up_args([spec for _, spec in items]), format),
+    ) as executor:
+        pending = {
+            executor.submit(
+                _render_chunk, chunk, format, fig_length, fig_width
+            ): chunk
+            for chunk in chunks
+        }
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = pending.pop(future)
+                    try:
+                        results = future.result()
+                    except BrokenExecutor as e:
+                        # The chunk never finished, e.g. its worker died.
+                        results = _errors(chunk, e)
+                    except Exception as e:
+                        # The chunk could not be sent to a worker. Only the
+                        # specs that cannot be pickled are reported, the
+                        # others are sent again.
+                        results, sendable = [], []
+                        for item in chunk:
+                            try:
+                                pickle.dumps(item)
+                            except Exception as item_error:
+                                results.extend(_errors([item], item_error))
+                            else:
+                                sendable.append(item)
+                        if not results:
+                            results = _errors(chunk, e)
+                        elif sendable:
+                            resent = executor.submit(
+                                _render_chunk,
+                                sendable,
+                                format,
+                                fig_length,
+                                fig_width,
+                            )
+                            pending[resent] = sendable
+                    yield from results
+        finally:
+            # A consumer that stops early does not wait for the rest.
+            executor.shutdown(cancel_futures=True)
@@ -0,0 +1,247 @@
+from collections.abc import Sequence
+from math import ceil, sqrt
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ._cache import LRUCache
+from ._visualization import Pitch, _axis_key, _axis_ref, _copy
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+_REF_KEYS = ("xaxis", "yaxis", "xref", "yref", "axref", "ayref")
+
+_cell_shapes_cache: LRUCache[tuple[Any, ...], tuple[dict[str, Any], ...]] = (
+    LRUCache(maxsize=128)
+)
+
+
+def _retarget(item: dict[str, Any], refs: dict[str, str]) -> dict[str, Any]:
+    return {
+        **item,
+        **{
+            key: refs[item[key]]
+            for key in _REF_KEYS
+            if key in item and item[key] in refs
+        },
+    }
+
+
+class PitchGrid:
+    def __init__(
+        self,
+        pitches: Sequence[Pitch],
+        *,
+        cols: int | None = None,
+        spacing: float = 0.02,
+        titles: Sequence[str] | None = None,
+        validate: bool = True,
+    ) -> None:
+        if not pitches:
+            raise ValueError("Invalid pitches: expected at least one pitch.")
+        if any(pitch._frames for pitch in pitches):
+            raise ValueError(
+                "Invalid pitches: animated pitches cannot be combined."
+            )
+        if cols is None:
+            cols = ceil(sqrt(len(pitches)))
+        if cols < 1:
+            raise ValueError(f"Invalid cols: {cols}. Expected >= 1.")
+        if not 0 <= spacing < 1 / max(cols, ceil(len(pitches) / cols)):
+            raise ValueError(
+                f"Invalid spacing: {spacing}. Expected less than a cell."
+            )
+        if titles is not None and len(titles) != len(pitches):
+            raise ValueError(
+                f"Invalid titles: expected {len(pitches)} titles, "
+                f"got {len(titles)}."
+            )
+        self._pitches = list(pitches)
+        self._cols = min(cols, len(pitches))
+        self._rows = ceil(len(pitches) / self._cols)
+        self._spacing = spacing
+        self._titles = list(titles) if titles is not None else None
+        self._validate = validate
+
+    @property
+    def pitches(self) -> list[Pitch]:
+        return self._pitches
+
+    @property
+    def fig(self) -> "go.Figure":
+        import plotly.graph_objects as go
+
+        fig_dict = self._fig_dict(None, None)
+        template = fig_dict["layout"].pop("template")
+        fig = go.Figure(fig_dict)
+        # Assigned without validation, as in Pitch._render.
+        fig._layout_obj._validate = False
+        try:
+            fig.layout.template = template
+        finally:
+            fig._layout_obj._validate = fig._validate
+        return fig
+
+    def __len__(self) -> int:
+        return len(self._pitches)
+
+    def __getitem__(self, index: int) -> Pitch:
+        return self._pitches[index]
+
+    def _domain(
+        self, index: int
+    ) -> tuple[tuple[float, float], tuple[float, float]]:
+        row, col = divmod(index, self._cols)
+        margin = self._spacing / 2
+        return (
+            (col / self._cols + margin, (col + 1) / self._cols - margin),
+            (
+                1 - (row + 1) / self._rows + margin,
+                1 - row / self._rows - margin,
+            ),
+        )
+
+    def _cell_shapes(
+        self, pitch: Pitch, background: int
+    ) -> tuple[dict[str, Any], ...]:
+        # Every cell with the same background shares the cached shapes of
+        # a single pitch, only moved onto the cell's axes.
+        refs = {
+            "x": _axis_ref("x", background),
+            "y": _axis_ref("y", background),
+        }
+        return _cell_shapes_cache.get_or_create(
+            (pitch._background_key(), background),
+            lambda: tuple(
+                _retarget(shape, refs) for shape in pitch._background_shapes()
+            ),
+        )
+
+    def _fig_dict(
+        self,
+        cell_length: int | float | None,
+        cell_width: int | float | None,
+    ) -> dict[str, Any]:
+        first = self._pitches[0]
+        if cell_length is None:
+            cell_length = 320
+        cell_length, cell_width = first._calc_fig_size(cell_length, cell_width)
+
+        data: list[dict[str, Any]] = []
+        shapes: list[dict[str, Any]] = []
+        images: list[dict[str, Any]] = []
+        annotations: list[dict[str, Any]] = []
+        layout: dict[str, Any] = {}
+        for index, pitch in enumerate(self._pitches):
+            # Cell i uses axis pair 2i + 1 for the background and 2i + 2
+            # for the data, so the first cell matches a single pitch.
+            background, overlay = 2 * index + 1, 2 * index + 2
+            domain = self._domain(index)
+            axes = pitch._axes(background, overlay, domain)
+            # Tick labels of neighbouring cells would overlap.
+            axes[_axis_key(_axis_ref("x", overlay))]["showticklabels"] = False
+            axes[_axis_key(_axis_ref("y", overlay))]["showticklabels"] = False
+            layout.update(axes)
+
+            refs = {
+                "x2": _axis_ref("x", overlay),
+                "y2": _axis_ref("y", overlay),
+            }
+            data.extend(
+                _retarget(trace, refs)
+                for trace in pitch._output_traces(
+                    pitch._traces, pitch._use_webgl()
+                )
+            )
+            shapes.extend(_copy(list(self._cell_shapes(pitch, background))))
+            images.extend(
+                _retarget(image, refs)
+                for image in pitch._output_images(pitch._images)
+            )
+            annotations.extend(
+                _retarget(annotation, refs)
+                for annotation in pitch._output_annotations(pitch._annotations)
+            )
+            if self._titles is not None:
+                annotations.append(
+                    dict(
+                        text=self._titles[index],
+                        x=sum(domain[0]) / 2,
+                        y=domain[1][1],
+                        xref="paper",
+                        yref="paper",
+                        xanchor="center",
+                        yanchor="bottom",
+                        showarrow=False,
+                        font={"color": pitch.theme.text},
+                    )
+                )
+
+        # The figure takes its background and default trace styling from
+        # the first pitch's theme.
+        return {
+            "data": data,
+            "layout": {
+                **layout,
+                "paper_bgcolor": first.theme.background,
+                "width": cell_length * self._cols,
+                "height": cell_width * self._rows,
+                "shapes": shapes,
+                "images": images,
+                "annotations": annotations,
+                "template": _copy(first._template()),
+            },
+        }
+
+    def to_dict(
+        self,
+        cell_length: int | float | None = None,
+        cell_width: int | float | None = None,
+    ) -> dict[str, Any]:
+        fig_dict = self._fig_dict(cell_length, cell_width)
+        if self._validate:
+            import plotly.graph_objects as go
+
+            validated: dict[str, Any] = go.Figure(fig_dict).to_dict()
+            return validated
+        return fig_dict
+
+    def to_json(
+        self,
+        cell_length: int | float | None = None,
+        cell_width: int | float | None = None,
+    ) -> str:
+        import plotly.io as pio
+
+        payload: str = pio.to_json(
+            self.to_dict(cell_length, cell_width), validate=False
+        )
+        return payload
+
+    def write_html(
+        self,
+        file: Path | str,
+        cell_length: int | float | None = None,
+        cell_width: int | float | None = None,
+        *,
+        include_plotlyjs: bool | str = "cdn",
+        full_html: bool = True,
+    ) -> None:
+        import plotly.io as pio
+
+        pio.write_html(
+            self.to_dict(cell_length, cell_width),
+            file,
+            validate=False,
+            include_plotlyjs=include_plotlyjs,
+            full_html=full_html,
+        )
+
+    def show(
+        self,
+        cell_length: int | float | None = None,
+        cell_width: int | float | None = None,
+    ) -> None:
+        import plotly.io as pio
+
+        pio.show(self.to_dict(cell_length, cell_width), validate=False)
@@ -0,0 +1,143 @@
+from collections.abc import AsyncIterable
+from typing import TYPE_CHECKING, TypedDict
+
+from ._visualization import Pitch
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+class _EventBase(TypedDict):
+    x: float
+    y: float
+
+
+class LiveEvent(_EventBase, total=False):
+    color: str
+    size: int
+    text: str
+
+
+class LivePitch:
+    def __init__(
+        self,
+        pitch: Pitch,
+        *,
+        max_fps: float = 10,
+        max_points: int | None = None,
+        fig_length: int | float | None = None,
+        fig_width: int | float | None = None,
+    ) -> None:
+        if max_fps <= 0:
+            raise ValueError(f"Invalid max_fps: {max_fps}. Expected > 0.")
+        if max_points is not None and max_points < 1:
+            raise ValueError(
+                f"Invalid max_points: {max_points}. Expected >= 1."
+            )
+        self._pitch = pitch
+        self._interval = 1 / max_fps
+        self._max_points = max_points
+        self._fig_length = fig_length
+        self._fig_width = fig_width
+
+        self._widget: go.FigureWidget | None = None
+        self._buffer: list[LiveEvent] = []
+        self._x: list[float] = []
+        self._y: list[float] = []
+        self._colors: list[str] = []
+        self._sizes: list[int] = []
+        self._texts: list[str] = []
+        self._updates = 0
+
+    @property
+    def pitch(self) -> Pitch:
+        return self._pitch
+
+    @property
+    def widget(self) -> "go.FigureWidget":
+        if self._widget is None:
+            import plotly.graph_objects as go
+
+            self._widget = go.FigureWidget(
+                self._pitch.to_dict(self._fig_length, self._fig_width)
+            )
+            self._widget.add_scatter(
+                x=[],
+                y=[],
+                mode="markers+text",
+                textposition="top center",
+                textfont={"color": self._pitch.theme.text},
+                showlegend=False,
+                xaxis="x2",
+                yaxis="y2",
+            )
+        return self._widget
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def push(
+        self,
+        x: float,
+        y: float,
+        *,
+        color: str | None = None,
+        size: int = 10,
+        text: str = "",
+    ) -> None:
+        event = LiveEvent(x=x, y=y, size=size, text=text)
+        if color is not None:
+            event["color"] = color
+        self._buffer.append(event)
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        for event in self._buffer:
+            self._x.append(event["x"])
+            self._y.append(event["y"])
+            self._colors.append(
+                event.get("color", self._pitch.theme.home_team)
+            )
+            self._sizes.append(event.get("size", 10))
+            self._texts.append(event.get("text", ""))
+        self._buffer.clear()
+        if self._max_points is not None:
+            del self._x[: -self._max_points]
+            del self._y[: -self._max_points]
+            del self._colors[: -self._max_points]
+            del self._sizes[: -self._max_points]
+            del self._texts[: -self._max_points]
+
+        # One batched update per flush, however many events arrived.
+        widget = self.widget
+        trace = widget.data[-1]
+        with widget.batch_update():
+            trace.x = self._x
+            trace.y = self._y
+            trace.text = self._texts
+            trace.marker.color = self._colors
+            trace.marker.size = self._sizes
+        self._updates += 1
+
+    async def consume(self, source: AsyncIterable[LiveEvent]) -> None:
+        # Imported here so that importing the package does not load it.
+        import asyncio
+
+        async def pump() -> None:
+            async for event in source:
+                self._buffer.append(event)
+
+        # Events are only buffered as they arrive; the widget is updated at
+        # most once per interval, so bursts never cause a re-render storm.
+        task = asyncio.ensure_future(pump())
+        try:
+            while not task.done():
+                await asyncio.wait({task}, timeout=self._interval)
+                self.flush()
+        finally:
+            if not task.done():
+                task.cancel()
+        await task
+        self.flush()
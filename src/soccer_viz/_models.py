@@ -1,6 +1,11 @@
-from math import isclose
+from collections.abc import Callable
 from typing import Literal, TypedDict
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._voronoi import voronoi_frames
+
 
 class Area(TypedDict):
     x0: float
@@ -22,7 +27,102 @@ class Standard:
     MARK_RADIUS = 0.2
 
 
+Range = tuple[float, float]
+
+# Provider coordinates as (x range, y range), x along the touch line and y
+# along the goal line. A reversed range means the provider's axis points the
+# other way, e.g. y = 0 on the top touch line.
+PROVIDERS: dict[str, Callable[["PitchMarkings"], tuple[Range, Range]]] = {
+    "opta": lambda markings: ((0, 100), (0, 100)),
+    "wyscout": lambda markings: ((0, 100), (100, 0)),
+    "statsbomb": lambda markings: ((0, 120), (80, 0)),
+    "metrica": lambda markings: ((0, 1), (1, 0)),
+    "secondspectrum": lambda markings: (
+        (-markings.touch_line / 2, markings.touch_line / 2),
+        (-markings.goal_line / 2, markings.goal_line / 2),
+    ),
+    "tracab": lambda markings: (
+        (-markings.touch_line * 50, markings.touch_line * 50),
+        (-markings.goal_line * 50, markings.goal_line * 50),
+    ),
+}
+
+
+def _rescale(
+    values: NDArray[np.float64], source: Range, target: Range
+) -> NDArray[np.float64]:
+    scale = (target[1] - target[0]) / (source[1] - source[0])
+    return (values - source[0]) * scale + target[0]
+
+
+def _in_rect(
+    x: NDArray[np.float64], y: NDArray[np.float64], area: Area
+) -> NDArray[np.bool_]:
+    x0, x1 = sorted((area["x0"], area["x1"]))
+    y0, y1 = sorted((area["y0"], area["y1"]))
+    return (x >= x0) & (x <= x1) & (y >= y0) & (y <= y1)
+
+
+def _in_circle(
+    x: NDArray[np.float64], y: NDArray[np.float64], area: Area
+) -> NDArray[np.bool_]:
+    cx = (area["x0"] + area["x1"]) / 2
+    cy = (area["y0"] + area["y1"]) / 2
+    radius = abs(area["x1"] - area["x0"]) / 2
+    return (x - cx) ** 2 + (y - cy) ** 2 <= radius**2
+
+
+REGIONS = (
+    "left_goal_area",
+    "right_goal_area",
+    "left_penalty_area",
+    "right_penalty_area",
+    "left_penalty_arc",
+    "right_penalty_arc",
+    "centre_circle",
+    "pitch",
+)
+
+
+def _resolve(
+    value: float | None, standard: float, use_standard: bool, ratio: float
+) -> float:
+    if value is not None:
+        return value
+    if use_standard:
+        return standard
+    return ratio * standard
+
+
 class PitchMarkings:
+    __slots__ = (
+        "touch_line",
+        "goal_line",
+        "aspect_ratio",
+        "center_circle_radius",
+        "penalty_area_length",
+        "penalty_mark_distance",
+        "goal_area_length",
+        "corner_arc_radius",
+        "goal_width",
+        "goal_height",
+        "mark_radius",
+        "_key",
+    )
+
+    touch_line: float
+    goal_line: float
+    aspect_ratio: float
+    center_circle_radius: float
+    penalty_area_length: float
+    penalty_mark_distance: float
+    goal_area_length: float
+    corner_arc_radius: float
+    goal_width: float
+    goal_height: float
+    mark_radius: float
+    _key: tuple[float, ...]
+
     def __init__(
         self,
         *,
@@ -38,123 +138,87 @@ class PitchMarkings:
         goal_height: float | None = None,
         mark_radius: float | None = None,
     ) -> None:
-        self._touch_line = touch_line
-        self._goal_line = goal_line
-        self._use_standard = use_standard
-        self._center_circle_radius = center_circle_radius
-        self._penalty_area_length = penalty_area_length
-        self._penalty_mark_distance = penalty_mark_distance
-        self._goal_area_length = goal_area_length
-        self._corner_arc_radius = corner_arc_radius
-        self._goal_width = goal_width
-        self._goal_height = goal_height
-        self._mark_radius = mark_radius
-
-    @property
-    def touch_line(self) -> float:
-        return (
-            self._touch_line
-            if self._touch_line is not None
-            else Standard.TOUCH_LINE
+        touch_line = (
+            touch_line if touch_line is not None else Standard.TOUCH_LINE
         )
-
-    @property
-    def goal_line(self) -> float:
-        return (
-            self._goal_line
-            if self._goal_line is not None
-            else Standard.GOAL_LINE
+        goal_line = goal_line if goal_line is not None else Standard.GOAL_LINE
+        ratio = touch_line / Standard.TOUCH_LINE
+
+        # Everything is resolved once here, the markings are immutable
+        # afterwards and can be used as cache keys.
+        self._set_state(
+            (
+                touch_line,
+                goal_line,
+                goal_line / touch_line,
+                _resolve(
+                    center_circle_radius,
+                    Standard.CENTER_CIRCLE_RADIUS,
+                    use_standard,
+                    ratio,
+                ),
+                _resolve(
+                    penalty_area_length,
+                    Standard.PENALTY_AREA_LENGTH,
+                    use_standard,
+                    ratio,
+                ),
+                _resolve(
+                    penalty_mark_distance,
+                    Standard.PENALTY_MARK_DISTANCE,
+                    use_standard,
+                    ratio,
+                ),
+                _resolve(
+                    goal_area_length,
+                    Standard.GOAL_AREA_LENGTH,
+                    use_standard,
+                    ratio,
+                ),
+                _resolve(
+                    corner_arc_radius,
+                    Standard.CORNER_ARC_RADIUS,
+                    use_standard,
+                    ratio,
+                ),
+                _resolve(goal_width, Standard.GOAL_WIDTH, use_standard, ratio),
+                _resolve(
+                    goal_height, Standard.GOAL_HEIGHT, use_standard, ratio
+                ),
+                _resolve(
+                    mark_radius, Standard.MARK_RADIUS, use_standard, ratio
+                ),
+            )
         )
 
-    @property
-    def aspect_ratio(self) -> float:
-        return self.goal_line / self.touch_line
-
-    @property
-    def _touch_line_ratio(self) -> float:
-        return self.touch_line / Standard.TOUCH_LINE
-
-    @property
-    def center_circle_radius(self) -> float:
-        if self._center_circle_radius is None:
-            if self._use_standard:
-                return Standard.CENTER_CIRCLE_RADIUS
-            return self._touch_line_ratio * Standard.CENTER_CIRCLE_RADIUS
-        return self._center_circle_radius
-
-    @property
-    def penalty_area_length(self) -> float:
-        if self._penalty_area_length is None:
-            if self._use_standard:
-                return Standard.PENALTY_AREA_LENGTH
-            return self._touch_line_ratio * Standard.PENALTY_AREA_LENGTH
-        return self._penalty_area_length
-
-    @property
-    def penalty_mark_distance(self) -> float:
-        if self._penalty_mark_distance is None:
-            if self._use_standard:
-                return Standard.PENALTY_MARK_DISTANCE
-            return self._touch_line_ratio * Standard.PENALTY_MARK_DISTANCE
-        return self._penalty_mark_distance
-
-    @property
-    def goal_area_length(self) -> float:
-        if self._goal_area_length is None:
-            if self._use_standard:
-                return Standard.GOAL_AREA_LENGTH
-            return self._touch_line_ratio * Standard.GOAL_AREA_LENGTH
-        return self._goal_area_length
+    def _set_state(self, state: tuple[float, ...]) -> None:
+        for name, value in zip(self.__slots__[:-1], state):
+            object.__setattr__(self, name, value)
+        # Rounded so that values equal up to float noise, such as
+        # 0.1 + 0.2 and 0.3, compare and hash the same.
+        object.__setattr__(
+            self, "_key", tuple(round(value, 9) for value in state)
+        )
 
-    @property
-    def corner_arc_radius(self) -> float:
-        if self._corner_arc_radius is None:
-            if self._use_standard:
-                return Standard.CORNER_ARC_RADIUS
-            return self._touch_line_ratio * Standard.CORNER_ARC_RADIUS
-        return self._corner_arc_radius
+    def __getstate__(self) -> tuple[float, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__[:-1])
 
-    @property
-    def goal_width(self) -> float:
-        if self._goal_width is None:
-            if self._use_standard:
-                return Standard.GOAL_WIDTH
-            return self._touch_line_ratio * Standard.GOAL_WIDTH
-        return self._goal_width
+    def __setstate__(self, state: tuple[float, ...]) -> None:
+        self._set_state(state)
 
-    @property
-    def goal_height(self) -> float:
-        if self._goal_height is None:
-            if self._use_standard:
-                return Standard.GOAL_HEIGHT
-            return self._touch_line_ratio * Standard.GOAL_HEIGHT
-        return self._goal_height
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
-    @property
-    def mark_radius(self) -> float:
-        if self._mark_radius is None:
-            if self._use_standard:
-                return Standard.MARK_RADIUS
-            return self._touch_line_ratio * Standard.MARK_RADIUS
-        return self._mark_radius
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, PitchMarkings):
             return NotImplemented
-        return (
-            isclose(self.touch_line, value.touch_line)
-            and isclose(self.goal_line, value.goal_line)
-            and isclose(self.center_circle_radius, value.center_circle_radius)
-            and isclose(self.penalty_area_length, value.penalty_area_length)
-            and isclose(
-                self.penalty_mark_distance, value.penalty_mark_distance
-            )
-            and isclose(self.goal_area_length, value.goal_area_length)
-            and isclose(self.corner_arc_radius, value.corner_arc_radius)
-            and isclose(self.goal_width, value.goal_width)
-            and isclose(self.goal_height, value.goal_height)
-            and isclose(self.mark_radius, value.mark_radius)
-        )
+        return self._key == value._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
 
     def __repr__(self) -> str:
         return (
@@ -186,6 +250,7 @@ class PitchCoordinates:
         self._markings = markings
         self._vertical = vertical
         self._side = side
+        self._standard: PitchCoordinates | None = None
 
         self._full_touch_line_range, self._full_goal_line_range = (
             self._set_ranges(touch_line_range, goal_line_range)
@@ -244,6 +309,42 @@ class PitchCoordinates:
             xaxis_range, yaxis_range = goal_line_range, touch_line_range
         return xaxis_range, yaxis_range
 
+    def _provider_ranges(
+        self, provider: str | tuple[Range, Range]
+    ) -> tuple[Range, Range]:
+        if not isinstance(provider, str):
+            return provider
+        if provider not in PROVIDERS:
+            raise ValueError(
+                f"Invalid provider: {provider}. "
+                f"Expected one of {', '.join(PROVIDERS)}."
+            )
+        return PROVIDERS[provider](self._markings)
+
+    def transform(
+        self,
+        x: ArrayLike,
+        y: ArrayLike,
+        *,
+        provider: str | tuple[Range, Range],
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        # Points keep their full pitch position, so with a side set the
+        # other half falls outside the axis range.
+        x_range, y_range = self._provider_ranges(provider)
+        touch = _rescale(
+            np.asarray(x, dtype=np.float64),
+            x_range,
+            self._full_touch_line_range,
+        )
+        goal = _rescale(
+            np.asarray(y, dtype=np.float64),
+            y_range,
+            self._full_goal_line_range,
+        )
+        if self._vertical:
+            return goal, touch
+        return touch, goal
+
     @property
     def vertical(self) -> bool:
         return self._vertical
@@ -582,6 +683,142 @@ class PitchCoordinates:
             "y1": self._full_yaxis_length / 2 + self.markings.goal_width / 2,
         }
 
+    def _to_standard(
+        self, x: ArrayLike, y: ArrayLike
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        # Events are classified on a horizontal pitch starting at 0, where
+        # the area methods are defined, whatever this pitch's ranges are.
+        xs = np.asarray(x, dtype=np.float64)
+        ys = np.asarray(y, dtype=np.float64)
+        if self._vertical:
+            xs, ys = ys, xs
+        return (
+            _rescale(
+                xs, self._full_touch_line_range, (0, self._markings.touch_line)
+            ),
+            _rescale(
+                ys, self._full_goal_line_range, (0, self._markings.goal_line)
+            ),
+        )
+
+    def _from_standard(
+        self, x: NDArray[np.float64], y: NDArray[np.float64]
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        touch = _rescale(
+            x, (0, self._markings.touch_line), self._full_touch_line_range
+        )
+        goal = _rescale(
+            y, (0, self._markings.goal_line), self._full_goal_line_range
+        )
+        if self._vertical:
+            return goal, touch
+        return touch, goal
+
+    def _standard_coordinates(self) -> "PitchCoordinates":
+        if self._standard is None:
+            self._standard = PitchCoordinates(markings=self._markings)
+        return self._standard
+
+    def area_masks(
+        self, x: ArrayLike, y: ArrayLike
+    ) -> dict[str, NDArray[np.bool_]]:
+        xs, ys = self._to_standard(x, y)
+        standard = self._standard_coordinates()
+        left_penalty_area = _in_rect(xs, ys, standard.left_penalty_area())
+        right_penalty_area = _in_rect(xs, ys, standard.right_penalty_area())
+        return {
+            "left_goal_area": _in_rect(xs, ys, standard.left_goal_area()),
+            "right_goal_area": _in_rect(xs, ys, standard.right_goal_area()),
+            "left_penalty_area": left_penalty_area,
+            "right_penalty_area": right_penalty_area,
+            "left_penalty_arc": _in_circle(xs, ys, standard.left_penalty_arc())
+            & ~left_penalty_area,
+            "right_penalty_arc": _in_circle(
+                xs, ys, standard.right_penalty_arc()
+            )
+            & ~right_penalty_area,
+            "centre_circle": _in_circle(xs, ys, standard.centre_circle()),
+            "pitch": _in_rect(xs, ys, standard.pitch_area()),
+        }
+
+    def regions(self, x: ArrayLike, y: ArrayLike) -> NDArray[np.str_]:
+        # The most specific area wins, in the order of REGIONS.
+        masks = self.area_masks(x, y)
+        return np.select(
+            [masks[name] for name in REGIONS],
+            REGIONS,
+            default="outside",
+        )
+
+    def thirds(self, x: ArrayLike, y: ArrayLike) -> NDArray[np.int64]:
+        xs, ys = self._to_standard(x, y)
+        touch_line = self._markings.touch_line
+        third = np.minimum(np.floor(xs / touch_line * 3), 2).astype(np.int64)
+        inside = _in_rect(xs, ys, self._standard_coordinates().pitch_area())
+        return np.where(inside, third, -1)
+
+    def channels(self, x: ArrayLike, y: ArrayLike) -> NDArray[np.int64]:
+        # Wings, half-spaces and centre, split at the widths of the
+        # penalty area and the goal area.
+        xs, ys = self._to_standard(x, y)
+        standard = self._standard_coordinates()
+        penalty_area = standard.left_penalty_area()
+        goal_area = standard.left_goal_area()
+        edges = np.array(
+            [
+                penalty_area["y0"],
+                goal_area["y0"],
+                goal_area["y1"],
+                penalty_area["y1"],
+            ]
+        )
+        channel = np.searchsorted(edges, ys, side="right").astype(np.int64)
+        inside = _in_rect(xs, ys, standard.pitch_area())
+        return np.where(inside, channel, -1)
+
+    def dominant_regions(
+        self,
+        positions: ArrayLike,
+        *,
+        workers: int = 1,
+        batch_size: int = 16,
+    ) -> list[list[NDArray[np.float64]]]:
+        # Positions are (frames, players, 2), or (players, 2) for a single
+        # frame. Regions are solved in metres, where distances are
+        # isotropic, and clipped to this pitch's area. Missing players
+        # (NaN) get an empty region.
+        frames = np.asarray(positions, dtype=np.float64)
+        if frames.ndim == 2:
+            frames = frames[None]
+        if frames.ndim != 3 or frames.shape[-1] != 2:
+            raise ValueError(
+                f"Invalid positions: expected (frames, players, 2), "
+                f"got {frames.shape}."
+            )
+        area = self.pitch_area()
+        xs, ys = self._to_standard(
+            np.array([area["x0"], area["x1"]]),
+            np.array([area["y0"], area["y1"]]),
+        )
+        touch, goal = self._to_standard(frames[..., 0], frames[..., 1])
+        cells = voronoi_frames(
+            np.stack([touch, goal], axis=-1),
+            (xs.min(), ys.min(), xs.max(), ys.max()),
+            workers=workers,
+            batch_size=batch_size,
+        )
+        regions = []
+        for frame in cells:
+            regions.append(
+                [
+                    np.column_stack(
+                        self._from_standard(cell[:, 0], cell[:, 1])
+                    )
+                    for cell in frame
+                ]
+            )
+        return regions
+
 
 class BackgroundPitchCoordinates(PitchCoordinates):
     def __init__(
@@ -0,0 +1,200 @@
+from collections.abc import Iterable
+from itertools import repeat
+from math import pi, sqrt
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._cache import LRUCache, fingerprint
+from ._models import PitchMarkings
+
+_Params = tuple[float, float, float]
+
+
+def _arrival_times(
+    positions: NDArray[np.float64],
+    velocities: NDArray[np.float64],
+    grid: NDArray[np.float64],
+    reaction_time: float,
+    max_speed: float,
+) -> NDArray[np.float64]:
+    # Each player keeps moving with their current velocity while reacting,
+    # then runs straight at max_speed; the team arrives with its fastest
+    # player. Missing players (NaN) never arrive.
+    start = positions + velocities * reaction_time
+    dx = grid[None, None, :, 0] - start[:, :, None, 0]
+    dy = grid[None, None, :, 1] - start[:, :, None, 1]
+    times = reaction_time + np.sqrt(dx * dx + dy * dy) / max_speed
+    times[np.isnan(times)] = np.inf
+    return times.min(axis=1, initial=np.inf)
+
+
+def _control_batch(
+    home: NDArray[np.float64],
+    away: NDArray[np.float64],
+    home_velocities: NDArray[np.float64],
+    away_velocities: NDArray[np.float64],
+    grid: NDArray[np.float64],
+    params: _Params,
+) -> NDArray[np.float64]:
+    reaction_time, max_speed, sigma = params
+    home_time = _arrival_times(
+        home, home_velocities, grid, reaction_time, max_speed
+    )
+    away_time = _arrival_times(
+        away, away_velocities, grid, reaction_time, max_speed
+    )
+    # Control is logistic in the difference of arrival times, with the
+    # spread of a player's time to control the ball as sigma.
+    difference = np.nan_to_num(away_time - home_time, posinf=1e3, neginf=-1e3)
+    with np.errstate(over="ignore"):
+        return 1 / (1 + np.exp(-pi / (sqrt(3) * sigma) * difference))
+
+
+def _frames(
+    values: ArrayLike, name: str, shape: tuple[int, ...] | None = None
+) -> NDArray[np.float64]:
+    array = np.asarray(values, dtype=np.float64)
+    if array.ndim == 2:
+        array = array[None]
+    if array.ndim != 3 or array.shape[2] != 2:
+        raise ValueError(
+            f"Invalid {name}: expected (frames, players, 2), "
+            f"got {array.shape}."
+        )
+    if shape is not None and array.shape != shape:
+        raise ValueError(
+            f"Invalid {name}: expected shape {shape}, got {array.shape}."
+        )
+    return array
+
+
+class PitchControl:
+    def __init__(
+        self,
+        *,
+        markings: PitchMarkings | None = None,
+        grid: tuple[int, int] = (50, 32),
+        reaction_time: float = 0.7,
+        max_speed: float = 5.0,
+        sigma: float = 0.45,
+        cache_size: int = 32,
+    ) -> None:
+        if min(grid) < 1:
+            raise ValueError(f"Invalid grid: {grid}. Expected >= 1 cells.")
+        if max_speed <= 0:
+            raise ValueError(f"Invalid max_speed: {max_speed}. Expected > 0.")
+        if sigma <= 0:
+            raise ValueError(f"Invalid sigma: {sigma}. Expected > 0.")
+        self._markings = markings if markings is not None else PitchMarkings()
+        self._grid_shape = grid
+        self._params: _Params = (reaction_time, max_speed, sigma)
+
+        # Cell centres in metres, x along the touch line from the left goal
+        # line and y along the goal line.
+        nx, ny = grid
+        touch_line = self._markings.touch_line
+        goal_line = self._markings.goal_line
+        self._x = (np.arange(nx) + 0.5) * touch_line / nx
+        self._y = (np.arange(ny) + 0.5) * goal_line / ny
+        gx, gy = np.meshgrid(self._x, self._y)
+        self._grid = np.column_stack([gx.ravel(), gy.ravel()])
+        self._cache: LRUCache[str, NDArray[np.float64]] = LRUCache(
+            maxsize=cache_size
+        )
+
+    @property
+    def markings(self) -> PitchMarkings:
+        return self._markings
+
+    @property
+    def x(self) -> NDArray[np.float64]:
+        return self._x
+
+    @property
+    def y(self) -> NDArray[np.float64]:
+        return self._y
+
+    def evaluate(
+        self,
+        home: ArrayLike,
+        away: ArrayLike,
+        *,
+        home_velocities: ArrayLike | None = None,
+        away_velocities: ArrayLike | None = None,
+        workers: int = 1,
+        batch_size: int = 32,
+    ) -> NDArray[np.float64]:
+        # Positions and velocities are in metres (per second) on the
+        # standard pitch. Returns the home team's control, shaped
+        # (frames, y cells, x cells).
+        if workers < 1:
+            raise ValueError(f"Invalid workers: {workers}. Expected >= 1.")
+        if batch_size < 1:
+            raise ValueError(
+                f"Invalid batch_size: {batch_size}. Expected >= 1."
+            )
+        home_ = _frames(home, "home")
+        away_ = _frames(away, "away")
+        if len(home_) != len(away_):
+            raise ValueError(
+                f"Invalid away: expected {len(home_)} frames, "
+                f"got {len(away_)}."
+            )
+        home_v = (
+            np.zeros_like(home_)
+            if home_velocities is None
+            else _frames(home_velocities, "home_velocities", home_.shape)
+        )
+        away_v = (
+            np.zeros_like(away_)
+            if away_velocities is None
+            else _frames(away_velocities, "away_velocities", away_.shape)
+        )
+
+        # A frame range is keyed on its content, so evaluating the same
+        # range again, from any caller, is served from the cache.
+        key = fingerprint(home_, away_, home_v, away_v)
+        return self._cache.get_or_create(
+            key,
+            lambda: self._evaluate(
+                home_, away_, home_v, away_v, workers, batch_size
+            ),
+        )
+
+    def _evaluate(
+        self,
+        home: NDArray[np.float64],
+        away: NDArray[np.float64],
+        home_velocities: NDArray[np.float64],
+        away_velocities: NDArray[np.float64],
+        workers: int,
+        batch_size: int,
+    ) -> NDArray[np.float64]:
+        nx, ny = self._grid_shape
+        if len(home) == 0:
+            return np.empty((0, ny, nx))
+        ranges = [
+            slice(i, i + batch_size) for i in range(0, len(home), batch_size)
+        ]
+        batches = (
+            [home[r] for r in ranges],
+            [away[r] for r in ranges],
+            [home_velocities[r] for r in ranges],
+            [away_velocities[r] for r in ranges],
+            repeat(self._grid),
+            repeat(self._params),
+        )
+        results: Iterable[NDArray[np.float64]]
+        if workers > 1 and len(ranges) > 1:
+            # Only loaded when a pool is actually used.
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_control_batch, *batches))
+        else:
+            results = map(_control_batch, *batches)
+        control = np.concatenate(list(results)).reshape(-1, ny, nx)
+        # Cached results are shared between callers.
+        control.flags.writeable = False
+        return control
@@ -0,0 +1,63 @@
+from collections.abc import Callable
+from functools import wraps
+from time import perf_counter
+from typing import Any, TypedDict, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Called with a metric name and its value: the method name and elapsed
+# seconds for timings, "payload_bytes" and a byte count for serialisation.
+StatsHook = Callable[[str, float], None]
+
+
+class Timing(TypedDict):
+    calls: int
+    total: float
+    max: float
+
+
+class PitchStats(TypedDict):
+    traces: int
+    points: int
+    shapes: int
+    annotations: int
+    images: int
+    frames: int
+    image_bytes: int
+    payload_bytes: int | None
+    timings: dict[str, Timing]
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.timings: dict[str, Timing] = {}
+        self.hooks: list[StatsHook] = []
+        self.payload_bytes: int | None = None
+
+    def emit(self, name: str, value: float) -> None:
+        for hook in self.hooks:
+            hook(name, value)
+
+    def record(self, name: str, elapsed: float) -> None:
+        timing = self.timings.get(name)
+        if timing is None:
+            timing = self.timings[name] = Timing(calls=0, total=0.0, max=0.0)
+        timing["calls"] += 1
+        timing["total"] += elapsed
+        timing["max"] = max(timing["max"], elapsed)
+        self.emit(name, elapsed)
+
+    def record_payload(self, size: int) -> None:
+        self.payload_bytes = size
+        self.emit("payload_bytes", size)
+
+    def timed(self, name: str, func: _F) -> _F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
@@ -0,0 +1,450 @@
+import re
+from collections.abc import Iterable
+from html import escape
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from ._visualization import Theme
+
+Range = tuple[float, float]
+_RGBA = tuple[float, float, float, float]
+
+_FONT = 'font-family="Open Sans, verdana, arial, sans-serif" font-size="12"'
+# Heatmap values are bucketed so cells of the same colour share one path.
+_COLOR_LEVELS = 64
+_RGB = re.compile(r"rgba?\(\s*([^)]*)\)")
+
+
+def _num(value: float) -> str:
+    return f"{round(value, 1):g}"
+
+
+def _parse_color(color: str) -> _RGBA | None:
+    if color.startswith("#") and len(color) in (4, 7, 9):
+        hex_ = color[1:]
+        if len(hex_) == 3:
+            hex_ = "".join(c * 2 for c in hex_)
+        try:
+            r, g, b = (float(int(hex_[i : i + 2], 16)) for i in range(0, 6, 2))
+            a = int(hex_[6:8], 16) / 255 if len(hex_) == 8 else 1.0
+        except ValueError:
+            return None
+        return r, g, b, a
+    match = _RGB.fullmatch(color.strip())
+    if match is None:
+        return None
+    values = [float(v) for v in match.group(1).split(",")]
+    if len(values) == 3:
+        values.append(1.0)
+    if len(values) != 4:
+        return None
+    r, g, b, a = values
+    return r, g, b, a
+
+
+def _colorscale(
+    colorscale: str | list[list[float | str]],
+) -> list[tuple[float, str]]:
+    if isinstance(colorscale, str):
+        # Named scales are only known to plotly.
+        from plotly.colors import get_colorscale
+
+        return [
+            (float(stop), str(color))
+            for stop, color in get_colorscale(colorscale)
+        ]
+    return [(float(stop), str(color)) for stop, color in colorscale]
+
+
+def _scale_colors(
+    t: NDArray[np.float64], colorscale: list[tuple[float, str]]
+) -> list[str]:
+    stops = np.array([stop for stop, _ in colorscale])
+    parsed = [_parse_color(color) for _, color in colorscale]
+    if any(rgba is None for rgba in parsed):
+        # Colours that cannot be interpolated snap to the nearest stop.
+        nearest = np.abs(t[:, None] - stops[None]).argmin(axis=1)
+        return [colorscale[i][1] for i in nearest]
+    channels = np.array(parsed, dtype=np.float64)
+    upper = np.clip(np.searchsorted(stops, t), 1, len(stops) - 1)
+    lower = upper - 1
+    span = stops[upper] - stops[lower]
+    weight = np.clip((t - stops[lower]) / np.where(span > 0, span, 1), 0, 1)[
+        :, None
+    ]
+    rgba = channels[lower] * (1 - weight) + channels[upper] * weight
+    return [f"rgba({r:.0f},{g:.0f},{b:.0f},{a:.2g})" for r, g, b, a in rgba]
+
+
+def _dasharray(dash: str, width: float) -> str | None:
+    # The same patterns plotly uses, scaled by the line width.
+    unit = max(width, 3)
+    pattern = {
+        "dot": (1, 1),
+        "dash": (3, 3),
+        "longdash": (5, 5),
+        "dashdot": (3, 1, 1, 1),
+        "longdashdot": (5, 2, 1, 2),
+    }.get(dash)
+    if pattern is None:
+        return None
+    return ",".join(_num(step * unit) for step in pattern)
+
+
+def _attrs(**attrs: Any) -> str:
+    return "".join(
+        f' {key.replace("_", "-")}="{escape(str(value))}"'
+        for key, value in attrs.items()
+        if value is not None
+    )
+
+
+def _per_point(value: Any, n: int) -> list[Any]:
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return list(value)
+    return [value] * n
+
+
+class _Axes:
+    # Maps one axis pair's data coordinates onto the plot box in pixels.
+    def __init__(
+        self,
+        x_range: Range,
+        y_range: Range,
+        box: tuple[float, float, float, float],
+    ) -> None:
+        left, top, width, height = box
+        self.scale_x = width / (x_range[1] - x_range[0])
+        self.scale_y = -height / (y_range[1] - y_range[0])
+        self.offset_x = left - x_range[0] * self.scale_x
+        self.offset_y = top + height - y_range[0] * self.scale_y
+
+    def x(self, values: Any) -> NDArray[np.float64]:
+        array = np.asarray(values, dtype=np.float64)
+        return array * self.scale_x + self.offset_x
+
+    def y(self, values: Any) -> NDArray[np.float64]:
+        array = np.asarray(values, dtype=np.float64)
+        return array * self.scale_y + self.offset_y
+
+
+def _path(
+    px: NDArray[np.float64], py: NDArray[np.float64], close: bool = False
+) -> str:
+    # Gaps (NaN) start a new subpath, as they break a plotly line.
+    valid = ~(np.isnan(px) | np.isnan(py))
+    starts = valid & ~np.concatenate([[False], valid[:-1]])
+    ends = valid & ~np.concatenate([valid[1:], [False]])
+    parts = []
+    for x, y, start, end in zip(
+        px[valid].tolist(),
+        py[valid].tolist(),
+        starts[valid].tolist(),
+        ends[valid].tolist(),
+    ):
+        parts.append(f"{'M' if start else 'L'}{_num(x)} {_num(y)}")
+        if end and close:
+            parts.append("Z")
+    return "".join(parts)
+
+
+def _shape(shape: dict[str, Any], axes: _Axes) -> str:
+    x0, x1 = axes.x([shape["x0"], shape["x1"]]).tolist()
+    y0, y1 = axes.y([shape["y0"], shape["y1"]]).tolist()
+    line = shape.get("line", {})
+    style = _attrs(
+        fill=shape.get("fillcolor", "none"),
+        stroke=line.get("color", "#444"),
+        stroke_width=line.get("width", 2),
+    )
+    if shape["type"] == "rect":
+        return (
+            f'<rect x="{_num(min(x0, x1))}" y="{_num(min(y0, y1))}" '
+            f'width="{_num(abs(x1 - x0))}" height="{_num(abs(y1 - y0))}"'
+            f"{style}/>"
+        )
+    if shape["type"] == "circle":
+        return (
+            f'<ellipse cx="{_num((x0 + x1) / 2)}" cy="{_num((y0 + y1) / 2)}" '
+            f'rx="{_num(abs(x1 - x0) / 2)}" ry="{_num(abs(y1 - y0) / 2)}"'
+            f"{style}/>"
+        )
+    return (
+        f'<line x1="{_num(x0)}" y1="{_num(y0)}" x2="{_num(x1)}" '
+        f'y2="{_num(y1)}"{style}/>'
+    )
+
+
+def _edges(centres: NDArray[np.float64]) -> NDArray[np.float64]:
+    if len(centres) == 1:
+        return np.array([centres[0] - 0.5, centres[0] + 0.5])
+    middle = (centres[1:] + centres[:-1]) / 2
+    return np.concatenate(
+        [
+            [2 * centres[0] - middle[0]],
+            middle,
+            [2 * centres[-1] - middle[-1]],
+        ]
+    )
+
+
+def _heatmap(trace: dict[str, Any], axes: _Axes, theme: "Theme") -> str:
+    # Cells are drawn flat; plotly's zsmooth has no SVG counterpart.
+    z = np.asarray(trace["z"], dtype=np.float64)
+    if z.size == 0:
+        return ""
+    xs = axes.x(_edges(np.asarray(trace["x"], dtype=np.float64)))
+    ys = axes.y(_edges(np.asarray(trace["y"], dtype=np.float64)))
+    zmin = trace.get("zmin", np.nanmin(z))
+    zmax = trace.get("zmax", np.nanmax(z))
+    rows, cols = np.nonzero(~np.isnan(z))
+    t = np.clip((z[rows, cols] - zmin) / ((zmax - zmin) or 1), 0, 1)
+    levels = np.round(t * _COLOR_LEVELS)
+    colorscale = _colorscale(
+        trace.get("colorscale")
+        or [[0, theme.background], [1, theme.home_team]]
+    )
+    unique, inverse = np.unique(levels, return_inverse=True)
+    colors = _scale_colors(unique / _COLOR_LEVELS, colorscale)
+
+    # Fully transparent cells, e.g. empty heatmap bins, are not drawn.
+    hidden = {
+        color for color in colors if (_parse_color(color) or (1,) * 4)[3] == 0
+    }
+    paths: dict[str, list[str]] = {}
+    for i, j, level in zip(rows.tolist(), cols.tolist(), inverse.tolist()):
+        color = colors[level]
+        if color in hidden:
+            continue
+        x0, x1 = sorted((xs[j], xs[j + 1]))
+        y0, y1 = sorted((ys[i], ys[i + 1]))
+        paths.setdefault(color, []).append(
+            f"M{_num(x0)} {_num(y0)}h{_num(x1 - x0)}v{_num(y1 - y0)}"
+            f"h{_num(x0 - x1)}Z"
+        )
+    body = "".join(
+        f'<path d="{"".join(d)}"{_attrs(fill=color)}/>'
+        for color, d in paths.items()
+    )
+    return f"<g{_attrs(opacity=trace.get('opacity'))}>{body}</g>"
+
+
+def _markers(
+    trace: dict[str, Any],
+    px: NDArray[np.float64],
+    py: NDArray[np.float64],
+    theme: "Theme",
+) -> str:
+    marker = trace.get("marker", {})
+    n = len(px)
+    styles = zip(
+        _per_point(marker.get("size", 6), n),
+        _per_point(marker.get("symbol", "circle"), n),
+        _per_point(marker.get("color", theme.home_team), n),
+        _per_point(marker.get("opacity", 1.0), n),
+    )
+    # Points sharing a style are one path. Circles and squares are
+    # zero-length strokes with round or square caps, the size of the
+    # marker; triangles are drawn as polygons.
+    groups: dict[tuple[Any, ...], list[str]] = {}
+    for x, y, style in zip(px.tolist(), py.tolist(), styles):
+        if x != x or y != y:
+            continue
+        size, symbol = style[0], style[1]
+        if symbol == "triangle-up":
+            h = size / 2
+            d = (
+                f"M{_num(x)} {_num(y - h)}L{_num(x + h)} {_num(y + h)}"
+                f"L{_num(x - h)} {_num(y + h)}Z"
+            )
+        else:
+            d = f"M{_num(x)} {_num(y)}h0"
+        groups.setdefault(style, []).append(d)
+
+    elements = []
+    for (size, symbol, color, opacity), commands in groups.items():
+        if symbol == "triangle-up":
+            attrs = _attrs(fill=color, opacity=opacity)
+        else:
+            attrs = _attrs(
+                fill="none",
+                stroke=color,
+                stroke_width=size,
+                stroke_linecap="square" if symbol == "square" else "round",
+                opacity=opacity,
+            )
+        elements.append(f'<path d="{"".join(commands)}"{attrs}/>')
+    return "".join(elements)
+
+
+def _texts(
+    trace: dict[str, Any],
+    px: NDArray[np.float64],
+    py: NDArray[np.float64],
+    theme: "Theme",
+) -> str:
+    n = len(px)
+    texts = _per_point(trace.get("text", ""), n)
+    sizes = _per_point(trace.get("marker", {}).get("size", 6), n)
+    vertical, _, horizontal = trace.get(
+        "textposition", "middle center"
+    ).partition(" ")
+    anchor = {"left": "end", "right": "start"}.get(horizontal, "middle")
+    elements = []
+    for x, y, text, size in zip(px.tolist(), py.tolist(), texts, sizes):
+        if not text or x != x or y != y:
+            continue
+        gap = size / 2 + 3 if "markers" in trace.get("mode", "") else 0
+        if horizontal == "left":
+            x -= gap
+        elif horizontal == "right":
+            x += gap
+        if vertical == "top":
+            y -= gap
+        elif vertical == "bottom":
+            y += gap + 12
+        else:
+            y += 4
+        elements.append(
+            f'<text x="{_num(x)}" y="{_num(y)}">{escape(str(text))}</text>'
+        )
+    if not elements:
+        return ""
+    color = trace.get("textfont", {}).get("color", theme.text)
+    return (
+        f"<g {_FONT}{_attrs(fill=color, text_anchor=anchor)}>"
+        f"{''.join(elements)}</g>"
+    )
+
+
+def _scatter(trace: dict[str, Any], axes: _Axes, theme: "Theme") -> str:
+    px, py = axes.x(trace["x"]), axes.y(trace["y"])
+    if len(px) == 0:
+        return ""
+    mode = trace.get("mode", "markers")
+    line = trace.get("line", {})
+    width = line.get("width", 2)
+    parts = []
+    if trace.get("fill") == "toself":
+        parts.append(
+            f'<path d="{_path(px, py, close=True)}"'
+            + _attrs(
+                fill=trace.get("fillcolor", theme.line),
+                stroke=line.get("color", theme.line) if width else None,
+                stroke_width=width or None,
+            )
+            + "/>"
+        )
+    elif "lines" in mode and width:
+        parts.append(
+            f'<path d="{_path(px, py)}"'
+            + _attrs(
+                fill="none",
+                stroke=line.get("color", theme.line),
+                stroke_width=width,
+                stroke_dasharray=_dasharray(line.get("dash", "solid"), width),
+            )
+            + "/>"
+        )
+    if "markers" in mode:
+        parts.append(_markers(trace, px, py, theme))
+    if "text" in mode:
+        parts.append(_texts(trace, px, py, theme))
+    body = "".join(parts)
+    opacity = trace.get("opacity", 1)
+    if opacity == 1:
+        return body
+    return f"<g{_attrs(opacity=opacity)}>{body}</g>"
+
+
+def _image(image: dict[str, Any], axes: _Axes) -> str:
+    width = abs(image["sizex"] * axes.scale_x)
+    height = abs(image["sizey"] * axes.scale_y)
+    x = float(axes.x(image["x"]))
+    y = float(axes.y(image["y"]))
+    x -= {"center": width / 2, "right": width}.get(image["xanchor"], 0)
+    y -= {"middle": height / 2, "bottom": height}.get(image["yanchor"], 0)
+    return (
+        f'<image href="{escape(image["source"])}" x="{_num(x)}" '
+        f'y="{_num(y)}" width="{_num(width)}" height="{_num(height)}"'
+        f"{_attrs(opacity=image.get('opacity'))}/>"
+    )
+
+
+def _arrow(annotation: dict[str, Any], axes: _Axes, theme: "Theme") -> str:
+    x0, x1 = axes.x([annotation["ax"], annotation["x"]]).tolist()
+    y0, y1 = axes.y([annotation["ay"], annotation["y"]]).tolist()
+    width = annotation.get("arrowwidth", 1)
+    color = annotation.get("arrowcolor", theme.line)
+    length = np.hypot(x1 - x0, y1 - y0)
+    if length == 0:
+        return ""
+    # A filled head at the tip, with the shaft stopping at its back.
+    head = min(3 * width * annotation.get("arrowsize", 1), length)
+    ux, uy = (x1 - x0) / length, (y1 - y0) / length
+    bx, by = x1 - ux * head, y1 - uy * head
+    half = head * 0.6
+    return (
+        f"<g{_attrs(opacity=annotation.get('opacity'))}>"
+        f'<line x1="{_num(x0)}" y1="{_num(y0)}" x2="{_num(bx)}" '
+        f'y2="{_num(by)}"{_attrs(stroke=color, stroke_width=width)}/>'
+        f'<path d="M{_num(x1)} {_num(y1)}L{_num(bx - uy * half)} '
+        f"{_num(by + ux * half)}L{_num(bx + uy * half)} "
+        f'{_num(by - ux * half)}Z"{_attrs(fill=color)}/></g>'
+    )
+
+
+def render_svg(
+    width: float,
+    height: float,
+    *,
+    background_range: tuple[Range, Range],
+    data_range: tuple[Range, Range],
+    shapes: Iterable[dict[str, Any]],
+    traces: Iterable[dict[str, Any]],
+    images: Iterable[dict[str, Any]],
+    annotations: Iterable[dict[str, Any]],
+    theme: "Theme",
+) -> str:
+    # The pitch keeps its aspect ratio and is centred in the image, as
+    # plotly does with the scale-anchored axes. Both axis pairs span the
+    # same box, so the data axes stay aligned with the markings.
+    (bx0, bx1), (by0, by1) = background_range
+    scale = min(width / abs(bx1 - bx0), height / abs(by1 - by0))
+    box_width, box_height = abs(bx1 - bx0) * scale, abs(by1 - by0) * scale
+    box = (
+        (width - box_width) / 2,
+        (height - box_height) / 2,
+        box_width,
+        box_height,
+    )
+    axes = {
+        "x": _Axes(*background_range, box),
+        "x2": _Axes(*data_range, box),
+    }
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{_num(width)}" '
+        f'height="{_num(height)}" viewBox="0 0 {_num(width)} '
+        f'{_num(height)}">',
+        f'<rect width="100%" height="100%"{_attrs(fill=theme.background)}/>',
+    ]
+    parts.extend(_shape(shape, axes[shape["xref"]]) for shape in shapes)
+    for trace in traces:
+        trace_axes = axes[trace.get("xaxis", "x")]
+        if trace["type"] == "heatmap":
+            parts.append(_heatmap(trace, trace_axes, theme))
+        else:
+            parts.append(_scatter(trace, trace_axes, theme))
+    parts.extend(_image(image, axes[image["xref"]]) for image in images)
+    # Only arrows are drawn; pitches add no text annotations.
+    parts.extend(
+        _arrow(annotation, axes[annotation["xref"]], theme)
+        for annotation in annotations
+        if "ax" in annotation
+    )
+    parts.append("</svg>")
+    return "".join(parts)
@@ -1,14 +1,262 @@
 import base64
+import hashlib
+from collections.abc import Sequence
+from functools import lru_cache
+from math import ceil, hypot
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
-import plotly.graph_objects as go
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
+from ._cache import LRUCache, fingerprint
 from ._models import (
+    Area,
     BackgroundPitchCoordinates,
     PitchCoordinates,
     PitchMarkings,
 )
+from ._stats import PitchStats, Recorder, StatsHook, Timing
+from ._svg import render_svg
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+_T = TypeVar("_T")
+
+_GRADIENT_STEPS = 20
+_WEBGL_THRESHOLD = 5000
+
+_GradientKey = tuple[str, float, float]
+_Dash = Literal["solid", "dot", "dash", "longdash", "dashdot"]
+
+# Methods wrapped with timers when a pitch is instrumented. Wrapping the
+# bound methods on the instance keeps uninstrumented pitches untouched.
+_TIMED_METHODS = (
+    "add_point",
+    "add_points",
+    "add_line",
+    "add_lines",
+    "add_gradient_line",
+    "add_annotation",
+    "add_arrows",
+    "add_triangle",
+    "add_polygons",
+    "add_voronoi",
+    "add_heatmap",
+    "add_surface",
+    "add_animation",
+    "_build_background_shapes",
+    "_file_to_data_uri",
+    "_draw_background",
+    "_draw_layers",
+    "_draw_template",
+    "_render",
+    "_validated_dict",
+    "show",
+    "to_dict",
+    "to_json",
+    "to_svg",
+    "write_html",
+    "write_svg",
+)
+
+_background_coordinates_cache: LRUCache[
+    tuple[Any, ...], BackgroundPitchCoordinates
+] = LRUCache(maxsize=32)
+_background_shapes_cache: LRUCache[
+    tuple[Any, ...], tuple[dict[str, Any], ...]
+] = LRUCache(maxsize=32)
+_image_digests_cache: LRUCache[tuple[str, int, int], str] = LRUCache(
+    maxsize=256
+)
+_data_uris_cache: LRUCache[tuple[str, str], str] = LRUCache(maxsize=64)
+_heatmap_cache: LRUCache[
+    tuple[Any, ...],
+    tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]],
+] = LRUCache(maxsize=32)
+
+
+def _bin_2d(
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    weights: NDArray[np.float64] | None,
+    bins: tuple[int, int],
+    x_range: tuple[float, float],
+    y_range: tuple[float, float],
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    z, x_edges, y_edges = np.histogram2d(
+        x, y, bins=bins, range=(x_range, y_range), weights=weights
+    )
+    x_centres = (x_edges[:-1] + x_edges[1:]) / 2
+    y_centres = (y_edges[:-1] + y_edges[1:]) / 2
+    # Heatmap rows run along y.
+    return x_centres, y_centres, z.T
+
+
+@lru_cache(maxsize=None)
+def _template_json(name: str) -> dict[str, Any]:
+    import plotly.io as pio
+
+    template = pio.templates[name]
+    return template.to_plotly_json()  # type: ignore[no-any-return]
+
+
+@lru_cache(maxsize=32)
+def _theme_template(
+    name: str, text: str, home_team: str, line: str
+) -> dict[str, Any]:
+    template = _template_json(name)
+    # Colours every layer shares live in the template once instead of
+    # being repeated on each trace.
+    defaults = {
+        "textfont": {"color": text},
+        "marker": {"color": home_team},
+        "line": {"color": line},
+    }
+    data = dict(template.get("data", {}))
+    for type_ in ("scatter", "scattergl"):
+        # Plotly cycles through a list of trace templates, so the defaults
+        # are merged into the first one rather than appended.
+        base, *rest = data.get(type_, [{}])
+        merged = {
+            **base,
+            **{
+                key: {**base.get(key, {}), **value}
+                for key, value in defaults.items()
+            },
+            "type": type_,
+        }
+        data[type_] = [merged, *rest]
+    return {**template, "data": data}
+
+
+def _broadcast(value: Any, n: int, name: str) -> list[Any]:
+    if value is None or isinstance(value, (str, int, float)):
+        return [value] * n
+    return _check_length(value, n, name)
+
+
+def _gapped(*points: NDArray[np.float64]) -> list[float | None]:
+    # Segments or shapes in one trace are separated by a gap, which plotly
+    # draws as a break in the line and fills as separate areas.
+    k = len(points) + 1
+    values = np.empty(k * len(points[0]), dtype=object)
+    for i, column in enumerate(points):
+        values[i::k] = column
+    return values[:-1].tolist()  # type: ignore[no-any-return]
+
+
+def _rings(
+    vertices: list[NDArray[np.float64]],
+) -> tuple[list[float | None], list[float | None]]:
+    # Each polygon is closed on its first vertex and followed by a gap, so
+    # one fill="toself" trace fills every polygon separately.
+    lengths = np.array([len(v) for v in vertices])
+    flat = np.concatenate(vertices)
+    starts = np.cumsum(lengths) - lengths
+    offsets = 2 * np.arange(len(lengths))
+    rings = np.full((len(flat) + 2 * len(lengths) - 1, 2), np.nan)
+    rings[np.arange(len(flat)) + np.repeat(offsets, lengths)] = flat
+    rings[starts + offsets + lengths] = flat[starts]
+    values = rings.astype(object)
+    values[np.isnan(rings)] = None
+    return values[:, 0].tolist(), values[:, 1].tolist()
+
+
+def _segments(
+    start_x: ArrayLike, start_y: ArrayLike, end_x: ArrayLike, end_y: ArrayLike
+) -> tuple[NDArray[np.float64], ...]:
+    x0, y0, x1, y1 = (
+        np.asarray(values, dtype=np.float64).ravel()
+        for values in (start_x, start_y, end_x, end_y)
+    )
+    n = len(x0)
+    for name, values in (("start_y", y0), ("end_x", x1), ("end_y", y1)):
+        if len(values) != n:
+            raise ValueError(
+                f"Invalid {name}: expected {n} values, got {len(values)}."
+            )
+    return x0, y0, x1, y1
+
+
+def _group_styles(
+    *styles: list[Any],
+) -> dict[tuple[Any, ...], NDArray[np.intp]]:
+    # Indices of the items sharing each style, in order of first appearance.
+    groups: dict[tuple[Any, ...], list[int]] = {}
+    for i, style in enumerate(zip(*styles)):
+        groups.setdefault(style, []).append(i)
+    return {style: np.asarray(indices) for style, indices in groups.items()}
+
+
+def _arrow_heads(
+    x0: NDArray[np.float64],
+    y0: NDArray[np.float64],
+    x1: NDArray[np.float64],
+    y1: NDArray[np.float64],
+    scale: tuple[float, float],
+    length: float,
+    width: float,
+) -> tuple[NDArray[np.float64], ...]:
+    # Heads are built in pitch units, where both axes have the same scale
+    # on screen, so they keep their shape however the data axes stretch.
+    sx, sy = scale
+    dx = (x1 - x0) * sx
+    dy = (y1 - y0) * sy
+    norm = np.hypot(dx, dy)
+    safe = np.where(norm > 0, norm, 1)
+    ux, uy = dx / safe, dy / safe
+    head = np.minimum(length, norm)
+    back_x = x1 - ux * head / sx
+    back_y = y1 - uy * head / sy
+    half = width / 2 * (head / length)
+    left_x = back_x - uy * half / sx
+    left_y = back_y + ux * half / sy
+    right_x = back_x + uy * half / sx
+    right_y = back_y - ux * half / sy
+    return back_x, back_y, left_x, left_y, right_x, right_y
+
+
+def _copy(value: Any) -> Any:
+    # Output dicts must not share objects with a pitch's layers or the
+    # module caches, or editing one figure would change every later one.
+    # Layers hold plain JSON-like values, so nested dicts and lists are
+    # copied and lists of scalars only shallowly.
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        if value and isinstance(value[0], (dict, list)):
+            return [_copy(item) for item in value]
+        return list(value)
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    return value
+
+
+def _quantize(values: Any, precision: int | None) -> Any:
+    if precision is None:
+        return values
+    if isinstance(values, np.ndarray):
+        return np.round(values, precision)
+    return [None if v is None else round(v, precision) for v in values]
+
+
+def _axis_ref(letter: Literal["x", "y"], number: int) -> str:
+    return letter if number == 1 else f"{letter}{number}"
+
+
+def _axis_key(ref: str) -> str:
+    # "x" -> "xaxis", "y3" -> "yaxis3"
+    return f"{ref[0]}axis{ref[1:]}"
+
+
+def _check_length(value: Sequence[_T], n: int, name: str) -> list[_T]:
+    if len(value) != n:
+        raise ValueError(
+            f"Invalid {name}: expected {n} values, got {len(value)}."
+        )
+    return list(value)
 
 
 class Theme:
@@ -98,13 +346,23 @@ class Pitch:
         vertical: bool = False,
         side: Literal["left", "right", "both"] = "both",
         theme: Theme | None = None,
+        validate: bool = True,
+        render: Literal["svg", "webgl", "auto"] = "auto",
+        webgl_threshold: int = _WEBGL_THRESHOLD,
+        precision: int | None = None,
+        instrument: bool = False,
     ) -> None:
         self._vertical = vertical
         self._side = side
 
         self._markings = markings if markings is not None else PitchMarkings()
-        self._background_coordinates = BackgroundPitchCoordinates(
-            markings=self._markings, vertical=vertical, side=side
+        self._background_coordinates = (
+            _background_coordinates_cache.get_or_create(
+                (self._markings, vertical, side),
+                lambda: BackgroundPitchCoordinates(
+                    markings=self._markings, vertical=vertical, side=side
+                ),
+            )
         )
         self._coordinates = PitchCoordinates(
             touch_line_range=touch_line_range,
@@ -115,7 +373,81 @@ class Pitch:
         )
 
         self.theme = theme if theme is not None else DefaultTheme()
-        self.fig = go.Figure()
+        self._validate = validate
+        self._render_mode = render
+        self._webgl_threshold = webgl_threshold
+        self._precision = precision
+        self._fig: go.Figure | None = None
+
+        self._traces: list[dict[str, Any]] = []
+        self._images: list[dict[str, Any]] = []
+        self._annotations: list[dict[str, Any]] = []
+        self._frames: list[dict[str, Any]] = []
+        self._animation_controls: dict[str, Any] = {}
+        self._gradient_traces: dict[_GradientKey, int] = {}
+
+        self._rendered_traces = 0
+        # Where each rendered trace sits in fig.data, which may also hold
+        # traces added to the figure directly.
+        self._trace_positions: list[int] = []
+        self._rendered_images = 0
+        self._rendered_annotations = 0
+        self._rendered_frames = 0
+        self._rendered_webgl = False
+        self._dirty_traces: set[int] = set()
+        self._rendered_background: tuple[dict[str, Any], ...] = ()
+        self._rendered_layout: dict[str, Any] = {}
+        self._rendered_template: dict[str, Any] = {}
+
+        self._recorder: Recorder | None = None
+        if instrument:
+            self._instrument()
+
+    @property
+    def fig(self) -> "go.Figure":
+        self._draw_layers()
+        # Traces take their default colours from the template.
+        self._draw_template()
+        return self._figure()
+
+    def _instrument(self) -> Recorder:
+        if self._recorder is None:
+            self._recorder = Recorder()
+            for name in _TIMED_METHODS:
+                setattr(
+                    self, name, self._recorder.timed(name, getattr(self, name))
+                )
+        return self._recorder
+
+    def add_hook(self, hook: StatsHook) -> None:
+        self._instrument().hooks.append(hook)
+
+    def stats(self) -> PitchStats:
+        recorder = self._recorder
+        return PitchStats(
+            traces=len(self._traces),
+            points=sum(
+                len(trace["x"])
+                for trace in self._traces
+                if trace["type"] == "scatter"
+            ),
+            shapes=len(self._background_shapes()),
+            annotations=len(self._annotations),
+            images=len(self._images),
+            frames=len(self._frames),
+            image_bytes=sum(len(image["source"]) for image in self._images),
+            payload_bytes=(
+                recorder.payload_bytes if recorder is not None else None
+            ),
+            timings=(
+                {
+                    name: Timing(**timing)
+                    for name, timing in recorder.timings.items()
+                }
+                if recorder is not None
+                else {}
+            ),
+        )
 
     @property
     def markings(self) -> PitchMarkings:
@@ -133,147 +465,249 @@ class Pitch:
     def yaxis_range(self) -> tuple[float, float]:
         return self._coordinates.yaxis_range
 
-    def _draw_area(self) -> None:
-        self.fig.add_shape(
-            type="rect",
-            layer="below",
-            **self._background_coordinates.pitch_area(),
-            line_color=self.theme.border,
-            fillcolor=self.theme.background,
-            xref="x",
-            yref="y",
-        )
-
-    def _draw_centre(self) -> None:
-        self.fig.add_shape(
-            type="circle",
-            layer="below",
-            **self._background_coordinates.centre_circle(),
-            line_color=self.theme.border,
-            fillcolor=self.theme.background,
-            xref="x",
-            yref="y",
-        )
-        self.fig.add_shape(
-            type="circle",
-            layer="below",
-            **self._background_coordinates.centre_mark(),
-            line_color=self.theme.border,
-            fillcolor=self.theme.background,
-            xref="x",
-            yref="y",
-        )
-        self.fig.add_shape(
-            type="line",
-            layer="below",
-            **self._background_coordinates.halfway_line(),
-            line_color=self.theme.border,
-            xref="x",
-            yref="y",
-        )
-
-    def _draw_left_side(self) -> None:
-        self.fig.add_shape(
-            type="circle",
-            layer="below",
-            **self._background_coordinates.left_penalty_arc(),
-            line_color=self.theme.border,
-            fillcolor=self.theme.background,
-            xref="x",
-            yref="y",
-        )
-        self.fig.add_shape(
-            type="rect",
-            layer="below",
-            **self._background_coordinates.left_penalty_area(),
-            line_color=self.theme.border,
-            fillcolor=self.theme.background,
-            xref="x",
-            yref="y",
-        )
-        self.fig.add_shape(
-            type="circle",
-            layer="below",
-            **self._background_coordinates.left_penalty_mark(),
-            line_color=self.theme.border,
-            fillcolor=self.theme.background,
-            xref="x",
-            yref="y",
-        )
-        self.fig.add_shape(
-            type="rect",
-            layer="below",
-            **self._background_coordinates.left_goal_area(),
-            line_color=self.theme.border,
-            fillcolor=self.theme.background,
-            xref="x",
-            yref="y",
-        )
-        self.fig.add_shape(
-            type="rect",
-            layer="below",
-            **self._background_coordinates.left_goal(),
-            line_color=self.theme.border,
-            fillcolor=self.theme.background,
-            xref="x",
-            yref="y",
-        )
-
-    def _draw_right_side(self) -> None:
-        self.fig.add_shape(
-            type="circle",
-            layer="below",
-            **self._background_coordinates.right_penalty_arc(),
-            line_color=self.theme.border,
-            fillcolor=self.theme.background,
-            xref="x",
-            yref="y",
-        )
-        self.fig.add_shape(
-            type="rect",
-            layer="below",
-            **self._background_coordinates.right_penalty_area(),
-            line_color=self.theme.border,
-            fillcolor=self.theme.background,
-            xref="x",
-            yref="y",
-        )
-        self.fig.add_shape(
-            type="circle",
-            layer="below",
-            **self._background_coordinates.right_penalty_mark(),
-            line_color=self.theme.border,
-            fillcolor=self.theme.background,
-            xref="x",
-            yref="y",
-        )
-        self.fig.add_shape(
-            type="rect",
-            layer="below",
-            **self._background_coordinates.right_goal_area(),
-            line_color=self.theme.border,
-            fillcolor=self.theme.background,
-            xref="x",
-            yref="y",
-        )
-        self.fig.add_shape(
-            type="rect",
-            layer="below",
-            **self._background_coordinates.right_goal(),
-            line_color=self.theme.border,
-            fillcolor=self.theme.background,
-            xref="x",
-            yref="y",
-        )
+    def _background_shape(
+        self,
+        type_: Literal["rect", "circle", "line"],
+        area: Area,
+    ) -> dict[str, Any]:
+        shape: dict[str, Any] = {
+            "type": type_,
+            "layer": "below",
+            **area,
+            "line": {"color": self.theme.border},
+            "xref": "x",
+            "yref": "y",
+        }
+        if type_ != "line":
+            shape["fillcolor"] = self.theme.background
+        return shape
 
-    def _draw_background(self) -> None:
-        self._draw_area()
+    def _area_shapes(self) -> list[dict[str, Any]]:
+        coordinates = self._background_coordinates
+        return [self._background_shape("rect", coordinates.pitch_area())]
+
+    def _centre_shapes(self) -> list[dict[str, Any]]:
+        coordinates = self._background_coordinates
+        return [
+            self._background_shape("circle", coordinates.centre_circle()),
+            self._background_shape("circle", coordinates.centre_mark()),
+            self._background_shape("line", coordinates.halfway_line()),
+        ]
+
+    def _left_side_shapes(self) -> list[dict[str, Any]]:
+        coordinates = self._background_coordinates
+        return [
+            self._background_shape("circle", coordinates.left_penalty_arc()),
+            self._background_shape("rect", coordinates.left_penalty_area()),
+            self._background_shape("circle", coordinates.left_penalty_mark()),
+            self._background_shape("rect", coordinates.left_goal_area()),
+            self._background_shape("rect", coordinates.left_goal()),
+        ]
+
+    def _right_side_shapes(self) -> list[dict[str, Any]]:
+        coordinates = self._background_coordinates
+        return [
+            self._background_shape("circle", coordinates.right_penalty_arc()),
+            self._background_shape("rect", coordinates.right_penalty_area()),
+            self._background_shape("circle", coordinates.right_penalty_mark()),
+            self._background_shape("rect", coordinates.right_goal_area()),
+            self._background_shape("rect", coordinates.right_goal()),
+        ]
+
+    def _build_background_shapes(self) -> tuple[dict[str, Any], ...]:
+        shapes = self._area_shapes()
         if self._side in ("left", "both"):
-            self._draw_left_side()
+            shapes.extend(self._left_side_shapes())
         if self._side in ("right", "both"):
-            self._draw_right_side()
+            shapes.extend(self._right_side_shapes())
         if self._side == "both":
-            self._draw_centre()
+            shapes.extend(self._centre_shapes())
+        return tuple(shapes)
+
+    def _background_key(self) -> tuple[Any, ...]:
+        return (
+            self._markings,
+            self._vertical,
+            self._side,
+            self.theme.border,
+            self.theme.background,
+        )
+
+    def _background_shapes(self) -> tuple[dict[str, Any], ...]:
+        return _background_shapes_cache.get_or_create(
+            self._background_key(), self._build_background_shapes
+        )
+
+    def _figure(self) -> "go.Figure":
+        # plotly is only imported once a figure is actually needed, so the
+        # geometry models and layer building work without paying for it.
+        if self._fig is None:
+            import plotly.graph_objects as go
+
+            self._fig = go.Figure()
+        return self._fig
+
+    def _draw_background(self) -> None:
+        shapes = self._background_shapes()
+        if shapes == self._rendered_background:
+            return
+        fig = self._figure()
+        # The background always comes first, so a theme change replaces
+        # the previous background without touching any other shapes.
+        others = fig.layout.shapes[len(self._rendered_background) :]
+        fig.update_layout(shapes=[*shapes, *others])
+        self._rendered_background = shapes
+
+    def _add_trace(
+        self, trace: dict[str, Any], *, gradient: bool = False
+    ) -> int:
+        if not gradient:
+            # Later gradient lines must be drawn above this trace, so they
+            # no longer extend the level traces before it.
+            self._gradient_traces.clear()
+        self._traces.append(trace)
+        return len(self._traces) - 1
+
+    def _use_webgl(self) -> bool:
+        if self._render_mode != "auto":
+            return self._render_mode == "webgl"
+        points = sum(
+            len(trace["x"])
+            for trace in self._traces
+            if trace["type"] == "scatter"
+        )
+        return points > self._webgl_threshold
+
+    def _output_traces(
+        self, traces: list[dict[str, Any]], webgl: bool
+    ) -> list[dict[str, Any]]:
+        output = [_copy(trace) for trace in traces]
+        for trace in output:
+            if webgl and trace["type"] == "scatter":
+                trace["type"] = "scattergl"
+            if self._precision is not None:
+                trace["x"] = _quantize(trace["x"], self._precision)
+                trace["y"] = _quantize(trace["y"], self._precision)
+        return output
+
+    def _output_items(
+        self, items: list[dict[str, Any]], keys: tuple[str, ...]
+    ) -> list[dict[str, Any]]:
+        if self._precision is None:
+            return [dict(item) for item in items]
+        return [
+            {
+                **item,
+                **{
+                    key: round(item[key], self._precision)
+                    for key in keys
+                    if key in item
+                },
+            }
+            for item in items
+        ]
+
+    def _output_images(
+        self, images: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        return self._output_items(images, ("x", "y"))
+
+    def _output_annotations(
+        self, annotations: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        return self._output_items(annotations, ("x", "y", "ax", "ay"))
+
+    def _template(self) -> dict[str, Any]:
+        import plotly.io as pio
+
+        return _theme_template(
+            pio.templates.default,
+            self.theme.text,
+            self.theme.home_team,
+            self.theme.line,
+        )
+
+    def _draw_layers(self) -> None:
+        fig = self._figure()
+        webgl = self._use_webgl()
+        if webgl != self._rendered_webgl:
+            # Trace types cannot be changed in place, so switching backend
+            # redraws this pitch's traces at the same positions. Traces
+            # added to the figure directly are left alone.
+            owned = set(self._trace_positions)
+            kept = [i for i in range(len(fig.data)) if i not in owned]
+            fig.data = [fig.data[i] for i in kept]
+            fig.add_traces(
+                self._output_traces(
+                    self._traces[: self._rendered_traces], webgl
+                )
+            )
+            order = [0] * len(fig.data)
+            for new, old in enumerate(kept):
+                order[old] = new
+            for new, old in enumerate(self._trace_positions, len(kept)):
+                order[old] = new
+            fig.data = [fig.data[i] for i in order]
+            self._dirty_traces.clear()
+            self._rendered_webgl = webgl
+        for index in self._dirty_traces:
+            fig.data[self._trace_positions[index]].update(
+                x=_quantize(self._traces[index]["x"], self._precision),
+                y=_quantize(self._traces[index]["y"], self._precision),
+            )
+        self._dirty_traces.clear()
+
+        if self._rendered_traces < len(self._traces):
+            self._trace_positions.extend(
+                range(
+                    len(fig.data),
+                    len(fig.data) + len(self._traces) - self._rendered_traces,
+                )
+            )
+            fig.add_traces(
+                self._output_traces(
+                    self._traces[self._rendered_traces :], webgl
+                )
+            )
+            self._rendered_traces = len(self._traces)
+        if self._rendered_images < len(self._images):
+            fig.update_layout(
+                images=[
+                    *fig.layout.images,
+                    *self._output_images(
+                        self._images[self._rendered_images :]
+                    ),
+                ]
+            )
+            self._rendered_images = len(self._images)
+        if self._rendered_annotations < len(self._annotations):
+            fig.update_layout(
+                annotations=[
+                    *fig.layout.annotations,
+                    *self._output_annotations(
+                        self._annotations[self._rendered_annotations :]
+                    ),
+                ]
+            )
+            self._rendered_annotations = len(self._annotations)
+        if self._rendered_frames < len(self._frames):
+            # Frames refer to traces by their position in the figure,
+            # which differs from the layer index once traces are added to
+            # the figure directly.
+            fig.frames = [
+                *fig.frames,
+                *(
+                    {
+                        **frame,
+                        "traces": [
+                            self._trace_positions[index]
+                            for index in frame["traces"]
+                        ],
+                    }
+                    for frame in self._frames[self._rendered_frames :]
+                ),
+            ]
+            self._rendered_frames = len(self._frames)
 
     def _file_to_data_uri(self, path: Path | str) -> str:
         suffix = Path(path).suffix.lower()
@@ -285,9 +719,25 @@ class Pitch:
             ".svg": "image/svg+xml",
             ".webp": "image/webp",
         }.get(suffix, "application/octet-stream")
+        stat = Path(path).stat()
+        file_key = (str(Path(path).resolve()), stat.st_mtime_ns, stat.st_size)
+        digest = _image_digests_cache.get(file_key)
+        if digest is not None:
+            uri = _data_uris_cache.get((digest, mime))
+            if uri is not None:
+                return uri
+
         data = Path(path).read_bytes()
-        b64 = base64.b64encode(data).decode("ascii")
-        return f"data:{mime};base64,{b64}"
+        digest = hashlib.sha256(data).hexdigest()
+        _image_digests_cache.put(file_key, digest)
+        # Keyed by content, so the same image under different paths is
+        # encoded once and every layout image shares the same string.
+        return _data_uris_cache.get_or_create(
+            (digest, mime),
+            lambda: (
+                f"data:{mime};base64," + base64.b64encode(data).decode("ascii")
+            ),
+        )
 
     def add_point(
         self,
@@ -302,25 +752,27 @@ class Pitch:
         symbol: Literal["circle", "square", "triangle-up"] = "circle",
         image_path: Path | str | None = None,
     ) -> None:
-        if color is None:
-            color = self.theme.home_team
-        self.fig.add_trace(
-            go.Scatter(
+        marker: dict[str, Any] = {"size": size, "symbol": symbol}
+        if color is not None:
+            marker["color"] = color
+        self._add_trace(
+            dict(
+                type="scatter",
                 x=[x],
                 y=[y],
                 mode="markers+text",
-                marker={"size": size, "color": color, "symbol": symbol},
+                marker=marker,
                 text=text if text is not None else "",
                 textposition="top center",
-                textfont={"color": self.theme.text},
                 opacity=opacity,
                 xaxis="x2",
                 yaxis="y2",
             )
         )
         if number is not None:
-            self.fig.add_trace(
-                go.Scatter(
+            self._add_trace(
+                dict(
+                    type="scatter",
                     x=[x],
                     y=[y],
                     mode="text",
@@ -333,7 +785,7 @@ class Pitch:
                 )
             )
         if image_path is not None:
-            self.fig.add_layout_image(
+            self._images.append(
                 dict(
                     source=self._file_to_data_uri(image_path),
                     x=x,
@@ -348,6 +800,93 @@ class Pitch:
                 )
             )
 
+    def add_points(
+        self,
+        x: Sequence[float] | NDArray[Any],
+        y: Sequence[float] | NDArray[Any],
+        *,
+        size: int | np.integer[Any] | Sequence[int] = 20,
+        text: str | Sequence[str] | None = None,
+        number: int | np.integer[Any] | Sequence[int | None] | None = None,
+        color: str | Sequence[str] | None = None,
+        opacity: float | Sequence[float] = 1.0,
+        symbol: Literal["circle", "square", "triangle-up"]
+        | Sequence[Literal["circle", "square", "triangle-up"]] = "circle",
+    ) -> None:
+        for name, values in (("x", x), ("y", y)):
+            if np.ndim(values) != 1:
+                raise ValueError(
+                    f"Invalid {name}: expected 1-D values, "
+                    f"got shape {np.shape(values)}."
+                )
+        # Copied, so later changes to the caller's arrays do not leak into
+        # the pitch.
+        x = np.array(x) if isinstance(x, np.ndarray) else list(x)
+        y = np.array(y) if isinstance(y, np.ndarray) else list(y)
+        n = len(x)
+        if len(y) != n:
+            raise ValueError(f"Invalid y: expected {n} values, got {len(y)}.")
+
+        marker: dict[str, Any] = {
+            "size": int(size)
+            if isinstance(size, (int, np.integer))
+            else _check_length(size, n, "size"),
+            "symbol": symbol
+            if isinstance(symbol, str)
+            else _check_length(symbol, n, "symbol"),
+        }
+        if color is not None:
+            marker["color"] = (
+                color
+                if isinstance(color, str)
+                else _check_length(color, n, "color")
+            )
+        if not isinstance(opacity, (int, float, np.floating)):
+            marker["opacity"] = _check_length(opacity, n, "opacity")
+            opacity = 1.0
+        self._add_trace(
+            dict(
+                type="scatter",
+                x=x,
+                y=y,
+                mode="markers+text",
+                marker=marker,
+                text=(
+                    ""
+                    if text is None
+                    else text
+                    if isinstance(text, str)
+                    else _check_length(text, n, "text")
+                ),
+                textposition="top center",
+                opacity=opacity,
+                xaxis="x2",
+                yaxis="y2",
+            )
+        )
+        if number is not None:
+            self._add_trace(
+                dict(
+                    type="scatter",
+                    x=x,
+                    y=y,
+                    mode="text",
+                    text=(
+                        str(number)
+                        if isinstance(number, (int, np.integer))
+                        else [
+                            str(value) if value is not None else ""
+                            for value in _check_length(number, n, "number")
+                        ]
+                    ),
+                    textposition="middle center",
+                    textfont={"color": self.theme.number},
+                    showlegend=False,
+                    xaxis="x2",
+                    yaxis="y2",
+                )
+            )
+
     def add_line(
         self,
         start_x: float,
@@ -358,18 +897,20 @@ class Pitch:
         color: str | None = None,
         width: float = 2,
         opacity: float = 1.0,
-        dash: Literal["solid", "dot", "dash", "longdash", "dashdot"] = "solid",
+        dash: _Dash = "solid",
         gradient: bool = False,
     ) -> None:
-        if color is None:
-            color = self.theme.line
         if not gradient:
-            self.fig.add_trace(
-                go.Scatter(
+            line: dict[str, Any] = dict(width=width, dash=dash)
+            if color is not None:
+                line["color"] = color
+            self._add_trace(
+                dict(
+                    type="scatter",
                     x=[start_x, end_x],
                     y=[start_y, end_y],
                     mode="lines",
-                    line=dict(color=color, width=width, dash=dash),
+                    line=line,
                     opacity=opacity,
                     xaxis="x2",
                     yaxis="y2",
@@ -388,6 +929,52 @@ class Pitch:
                 opacity_end=opacity,
             )
 
+    def add_lines(
+        self,
+        start_x: ArrayLike,
+        start_y: ArrayLike,
+        end_x: ArrayLike,
+        end_y: ArrayLike,
+        *,
+        color: str | Sequence[str] | None = None,
+        width: float | Sequence[float] = 2,
+        opacity: float | Sequence[float] = 1.0,
+        dash: _Dash | Sequence[_Dash] = "solid",
+    ) -> None:
+        x0, y0, x1, y1 = _segments(start_x, start_y, end_x, end_y)
+        n = len(x0)
+        groups = _group_styles(
+            _broadcast(color, n, "color"),
+            _broadcast(width, n, "width"),
+            _broadcast(opacity, n, "opacity"),
+            _broadcast(dash, n, "dash"),
+        )
+        # One trace per distinct style.
+        for (color_, width_, opacity_, dash_), index in groups.items():
+            line: dict[str, Any] = dict(width=width_, dash=dash_)
+            if color_ is not None:
+                line["color"] = color_
+            self._add_trace(
+                dict(
+                    type="scatter",
+                    x=_gapped(x0[index], x1[index]),
+                    y=_gapped(y0[index], y1[index]),
+                    mode="lines",
+                    line=line,
+                    opacity=opacity_,
+                    showlegend=False,
+                    xaxis="x2",
+                    yaxis="y2",
+                )
+            )
+
+    def _gradient_steps(self, length: float) -> int:
+        diagonal = hypot(
+            self._coordinates.xaxis_length, self._coordinates.yaxis_length
+        )
+        steps = ceil(_GRADIENT_STEPS * 4 * length / diagonal)
+        return max(2, min(_GRADIENT_STEPS, steps))
+
     def add_gradient_line(
         self,
         start_x: float,
@@ -400,11 +987,19 @@ class Pitch:
         width_end: float = 4,
         opacity_start: float = 0.1,
         opacity_end: float = 1.0,
-        steps: int = 20,
+        steps: int | None = None,
     ) -> None:
         if color is None:
             color = self.theme.line
+        if steps is None:
+            steps = self._gradient_steps(
+                hypot(end_x - start_x, end_y - start_y)
+            )
+        levels = max(steps, _GRADIENT_STEPS)
 
+        # Segments that share a width and opacity are drawn by the same
+        # trace, separated by gaps, so the number of traces is bounded by
+        # the number of levels rather than by the number of lines.
         for i in range(steps):
             t0 = i / steps
             t1 = (i + 1) / steps
@@ -412,20 +1007,36 @@ class Pitch:
             y0 = start_y + (end_y - start_y) * t0
             x1 = start_x + (end_x - start_x) * t1
             y1 = start_y + (end_y - start_y) * t1
-            width = width_start + (width_end - width_start) * t0
-            opacity = opacity_start + (opacity_end - opacity_start) * t0
-            self.fig.add_trace(
-                go.Scatter(
-                    x=[x0, x1],
-                    y=[y0, y1],
-                    mode="lines",
-                    line=dict(color=color, width=width),
-                    opacity=opacity,
-                    showlegend=False,
-                    xaxis="x2",
-                    yaxis="y2",
+            level = round(t0 * levels) / levels
+            width = width_start + (width_end - width_start) * level
+            opacity = opacity_start + (opacity_end - opacity_start) * level
+
+            key = (color, width, opacity)
+            index = self._gradient_traces.get(key)
+            if index is None:
+                index = self._add_trace(
+                    dict(
+                        type="scatter",
+                        x=[],
+                        y=[],
+                        mode="lines",
+                        line=dict(color=color, width=width),
+                        opacity=opacity,
+                        showlegend=False,
+                        xaxis="x2",
+                        yaxis="y2",
+                    ),
+                    gradient=True,
                 )
-            )
+                self._gradient_traces[key] = index
+            trace = self._traces[index]
+            if trace["x"]:
+                trace["x"].append(None)
+                trace["y"].append(None)
+            trace["x"].extend((x0, x1))
+            trace["y"].extend((y0, y1))
+            if index < self._rendered_traces:
+                self._dirty_traces.add(index)
 
     def add_annotation(
         self,
@@ -441,22 +1052,87 @@ class Pitch:
         if color is None:
             color = self.theme.line
 
-        self.fig.add_annotation(
-            ax=start_x,
-            ay=start_y,
-            x=end_x,
-            y=end_y,
-            xref="x",
-            yref="y",
-            axref="x",
-            ayref="y",
-            arrowhead=2,
-            arrowsize=1,
-            arrowwidth=width,
-            arrowcolor=color,
-            opacity=opacity,
+        self._annotations.append(
+            dict(
+                ax=start_x,
+                ay=start_y,
+                x=end_x,
+                y=end_y,
+                xref="x2",
+                yref="y2",
+                axref="x2",
+                ayref="y2",
+                arrowhead=2,
+                arrowsize=1,
+                arrowwidth=width,
+                arrowcolor=color,
+                opacity=opacity,
+            )
         )
 
+    def add_arrows(
+        self,
+        start_x: ArrayLike,
+        start_y: ArrayLike,
+        end_x: ArrayLike,
+        end_y: ArrayLike,
+        *,
+        color: str | Sequence[str] | None = None,
+        width: float | Sequence[float] = 2,
+        opacity: float | Sequence[float] = 1.0,
+        head_length: float = 2.0,
+        head_width: float = 1.6,
+    ) -> None:
+        x0, y0, x1, y1 = _segments(start_x, start_y, end_x, end_y)
+        n = len(x0)
+        colors = _broadcast(color, n, "color")
+        opacities = _broadcast(opacity, n, "opacity")
+        scale = (
+            self._background_coordinates.xaxis_length
+            / self._coordinates.xaxis_length,
+            self._background_coordinates.yaxis_length
+            / self._coordinates.yaxis_length,
+        )
+        back_x, back_y, left_x, left_y, right_x, right_y = _arrow_heads(
+            x0, y0, x1, y1, scale, head_length, head_width
+        )
+
+        # Shafts stop at the back of the head so wide lines never poke
+        # through the tip.
+        self.add_lines(
+            x0,
+            y0,
+            back_x,
+            back_y,
+            color=colors,
+            width=width,
+            opacity=opacities,
+        )
+        for (color_, opacity_), index in _group_styles(
+            colors, opacities
+        ).items():
+            fill = color_ if color_ is not None else self.theme.line
+            self._add_trace(
+                dict(
+                    type="scatter",
+                    x=_gapped(
+                        x1[index], left_x[index], right_x[index], x1[index]
+                    ),
+                    y=_gapped(
+                        y1[index], left_y[index], right_y[index], y1[index]
+                    ),
+                    mode="lines",
+                    fill="toself",
+                    fillcolor=fill,
+                    line=dict(width=0, color=fill),
+                    opacity=opacity_,
+                    hoverinfo="skip",
+                    showlegend=False,
+                    xaxis="x2",
+                    yaxis="y2",
+                )
+            )
+
     def add_triangle(
         self,
         a_x: float,
@@ -469,22 +1145,304 @@ class Pitch:
         color: str | None = None,
         opacity: float = 1,
     ) -> None:
-        if color is None:
-            color = self.theme.line
-        self.fig.add_trace(
-            go.Scatter(
-                x=[a_x, b_x, c_x, a_x],
-                y=[a_y, b_y, c_y, a_y],
-                mode="lines",
-                fill="toself",
-                fillcolor=color,
-                line=dict(color=color, width=2),
+        self.add_polygons(
+            [[(a_x, a_y), (b_x, b_y), (c_x, c_y)]],
+            color=color,
+            opacity=opacity,
+        )
+
+    def add_polygons(
+        self,
+        polygons: Sequence[ArrayLike],
+        *,
+        color: str | Sequence[str] | None = None,
+        opacity: float | Sequence[float] = 1,
+        width: float = 2,
+    ) -> None:
+        vertices = [np.asarray(p, dtype=np.float64) for p in polygons]
+        for i, v in enumerate(vertices):
+            if v.ndim != 2 or v.shape[1] != 2 or len(v) < 3:
+                raise ValueError(
+                    f"Invalid polygons: expected (vertices >= 3, 2) for "
+                    f"polygon {i}, got {v.shape}."
+                )
+        n = len(vertices)
+
+        # One trace per fill style, however many polygons share it.
+        for (color_, opacity_), index in _group_styles(
+            _broadcast(color, n, "color"), _broadcast(opacity, n, "opacity")
+        ).items():
+            fill = color_ if color_ is not None else self.theme.line
+            x, y = _rings([vertices[i] for i in index])
+            self._add_trace(
+                dict(
+                    type="scatter",
+                    x=x,
+                    y=y,
+                    mode="lines",
+                    fill="toself",
+                    fillcolor=fill,
+                    line=dict(color=fill, width=width),
+                    opacity=opacity_,
+                    xaxis="x2",
+                    yaxis="y2",
+                )
+            )
+
+    def add_voronoi(
+        self,
+        x: ArrayLike,
+        y: ArrayLike,
+        *,
+        color: str | Sequence[str] | None = None,
+        opacity: float = 0.3,
+        width: float = 1,
+    ) -> None:
+        xs = np.asarray(x, dtype=np.float64).ravel()
+        ys = np.asarray(y, dtype=np.float64).ravel()
+        n = len(xs)
+        if len(ys) != n:
+            raise ValueError(f"Invalid y: expected {n} values, got {len(ys)}.")
+        colors = _broadcast(color, n, "color")
+        (cells,) = self._coordinates.dominant_regions(
+            np.column_stack([xs, ys])
+        )
+        # Players off the pitch or without a position have no region.
+        drawn = [i for i, cell in enumerate(cells) if len(cell) >= 3]
+        self.add_polygons(
+            [cells[i] for i in drawn],
+            color=[colors[i] for i in drawn],
+            opacity=opacity,
+            width=width,
+        )
+
+    def add_heatmap(
+        self,
+        x: ArrayLike,
+        y: ArrayLike,
+        *,
+        weights: ArrayLike | None = None,
+        bins: int | tuple[int, int] | None = None,
+        colorscale: str | list[list[float | str]] | None = None,
+        opacity: float = 0.8,
+    ) -> None:
+        # Bins are (x, y) on the figure; by default about 5 m square cells,
+        # with more of them along the touch line.
+        if bins is None:
+            bins = (14, 21) if self._vertical else (21, 14)
+        if isinstance(bins, int):
+            bins = (bins, bins)
+        if colorscale is None:
+            colorscale = [
+                [0.0, self.theme.transparent],
+                [1.0, self.theme.home_team],
+            ]
+        xs = np.asarray(x, dtype=np.float64)
+        ys = np.asarray(y, dtype=np.float64)
+        ws = None if weights is None else np.asarray(weights, np.float64)
+        x_range = (min(self.xaxis_range), max(self.xaxis_range))
+        y_range = (min(self.yaxis_range), max(self.yaxis_range))
+
+        # Keyed on the data rather than the styling, so re-theming or
+        # redrawing the same events reuses the binned counts.
+        key = (
+            fingerprint(xs, ys) if ws is None else fingerprint(xs, ys, ws),
+            bins,
+            x_range,
+            y_range,
+        )
+        x_centres, y_centres, z = _heatmap_cache.get_or_create(
+            key, lambda: _bin_2d(xs, ys, ws, bins, x_range, y_range)
+        )
+        self._add_trace(
+            dict(
+                type="heatmap",
+                x=x_centres.tolist(),
+                y=y_centres.tolist(),
+                z=z.tolist(),
+                colorscale=colorscale,
                 opacity=opacity,
+                showscale=False,
+                hoverinfo="z",
                 xaxis="x2",
                 yaxis="y2",
             )
         )
 
+    def add_surface(
+        self,
+        z: ArrayLike,
+        *,
+        x: ArrayLike | None = None,
+        y: ArrayLike | None = None,
+        colorscale: str | list[list[float | str]] | None = None,
+        zmin: float = 0,
+        zmax: float = 1,
+        opacity: float = 0.6,
+    ) -> None:
+        values = np.asarray(z, dtype=np.float64)
+        if values.ndim != 2:
+            raise ValueError(
+                f"Invalid z: expected (y cells, x cells), got {values.shape}."
+            )
+        ny, nx = values.shape
+        if x is None and y is None:
+            # Without coordinates the cells evenly cover the full pitch in
+            # metres, as for PitchControl, with x along the touch line.
+            xs, ys = self._coordinates._from_standard(
+                (np.arange(nx) + 0.5) * self._markings.touch_line / nx,
+                (np.arange(ny) + 0.5) * self._markings.goal_line / ny,
+            )
+            if self._vertical:
+                values = values.T
+        elif x is not None and y is not None:
+            xs = np.asarray(x, dtype=np.float64)
+            ys = np.asarray(y, dtype=np.float64)
+        else:
+            raise ValueError("Invalid x, y: expected both or neither.")
+        if colorscale is None:
+            colorscale = [
+                [0.0, self.theme.away_team],
+                [0.5, self.theme.transparent],
+                [1.0, self.theme.home_team],
+            ]
+        self._add_trace(
+            dict(
+                type="heatmap",
+                x=xs.tolist(),
+                y=ys.tolist(),
+                z=values.tolist(),
+                zmin=zmin,
+                zmax=zmax,
+                colorscale=colorscale,
+                opacity=opacity,
+                zsmooth="best",
+                showscale=False,
+                hoverinfo="z",
+                xaxis="x2",
+                yaxis="y2",
+            )
+        )
+
+    def add_animation(
+        self,
+        positions: ArrayLike,
+        *,
+        color: str | Sequence[str] | None = None,
+        size: int | np.integer[Any] | Sequence[int] = 12,
+        text: Sequence[str] | None = None,
+        fps: float = 25,
+        step: int = 1,
+        max_frames: int = 1500,
+        precision: int = 2,
+    ) -> None:
+        if self._frames:
+            raise ValueError("Invalid animation: the pitch already has one.")
+        frames = np.asarray(positions, dtype=np.float64)
+        if frames.ndim != 3 or frames.shape[2] != 2:
+            raise ValueError(
+                f"Invalid positions: expected (frames, entities, 2), "
+                f"got {frames.shape}."
+            )
+        n_frames, n_entities, _ = frames.shape
+        if color is None:
+            color = self.theme.home_team
+
+        # Long clips are thinned so the figure never carries more than
+        # max_frames frames, and coordinates are rounded to keep every
+        # frame small.
+        step = max(step, ceil(n_frames / max_frames))
+        frames = np.round(frames[::step], precision)
+        index = self._add_trace(
+            dict(
+                type="scatter",
+                x=frames[0, :, 0].tolist(),
+                y=frames[0, :, 1].tolist(),
+                mode="markers" if text is None else "markers+text",
+                marker={
+                    "size": int(size)
+                    if isinstance(size, (int, np.integer))
+                    else _check_length(size, n_entities, "size"),
+                    "color": color
+                    if isinstance(color, str)
+                    else _check_length(color, n_entities, "color"),
+                },
+                text=None
+                if text is None
+                else _check_length(text, n_entities, "text"),
+                textposition="middle center",
+                textfont={"color": self.theme.number},
+                showlegend=False,
+                xaxis="x2",
+                yaxis="y2",
+            )
+        )
+
+        labels = [
+            f"{int(seconds // 60):02d}:{seconds % 60:04.1f}"
+            for seconds in np.arange(len(frames)) * step / fps
+        ]
+        self._frames = [
+            {
+                "name": str(i),
+                "data": [
+                    {"x": frame[:, 0].tolist(), "y": frame[:, 1].tolist()}
+                ],
+                "traces": [index],
+            }
+            for i, frame in enumerate(frames)
+        ]
+
+        duration = 1000 * step / fps
+        frame_args = {
+            "frame": {"duration": duration, "redraw": False},
+            "transition": {"duration": 0},
+            "mode": "immediate",
+        }
+        self._animation_controls = {
+            "updatemenus": [
+                {
+                    "type": "buttons",
+                    "showactive": False,
+                    "x": 0,
+                    "y": 0,
+                    "xanchor": "right",
+                    "yanchor": "top",
+                    "buttons": [
+                        {
+                            "label": "Play",
+                            "method": "animate",
+                            "args": [
+                                None,
+                                {**frame_args, "fromcurrent": True},
+                            ],
+                        },
+                        {
+                            "label": "Pause",
+                            "method": "animate",
+                            "args": [[None], frame_args],
+                        },
+                    ],
+                }
+            ],
+            "sliders": [
+                {
+                    "x": 0,
+                    "y": 0,
+                    "len": 1,
+                    "currentvalue": {"prefix": "", "visible": True},
+                    "steps": [
+                        {
+                            "label": label,
+                            "method": "animate",
+                            "args": [[str(i)], frame_args],
+                        }
+                        for i, label in enumerate(labels)
+                    ],
+                }
+            ],
+        }
+
     def _extend_axis_range(
         self, axis_range: tuple[float, float]
     ) -> tuple[float, float]:
@@ -514,66 +1472,232 @@ class Pitch:
                 )
         return length, width
 
+    def _axes(
+        self,
+        background: int = 1,
+        data: int = 2,
+        domain: tuple[tuple[float, float], tuple[float, float]] | None = None,
+    ) -> dict[str, Any]:
+        # The background is drawn on one axis pair and the data on another
+        # overlaid on it, so a pitch's data ranges never move its markings.
+        # The pairs are numbered like plotly's axes, with 1 for "x"/"y".
+        bx, by = _axis_ref("x", background), _axis_ref("y", background)
+        dx, dy = _axis_ref("x", data), _axis_ref("y", data)
+        xaxis: dict[str, Any] = dict(
+            range=self._extend_axis_range(
+                self._background_coordinates.xaxis_range
+            ),
+            showgrid=False,
+            zeroline=False,
+            showticklabels=False,
+        )
+        yaxis: dict[str, Any] = dict(
+            range=self._extend_axis_range(
+                self._background_coordinates.yaxis_range
+            ),
+            showgrid=False,
+            zeroline=False,
+            showticklabels=False,
+        )
+        xaxis2: dict[str, Any] = dict(
+            range=self._extend_axis_range(self._coordinates.xaxis_range),
+            showgrid=False,
+            zeroline=False,
+            overlaying=bx,
+        )
+        yaxis2: dict[str, Any] = dict(
+            range=self._extend_axis_range(self._coordinates.yaxis_range),
+            showgrid=False,
+            zeroline=False,
+            overlaying=by,
+        )
+        if domain is not None:
+            for axis, ref in ((xaxis, by), (xaxis2, dy)):
+                axis.update(domain=domain[0], anchor=ref)
+            for axis, ref in ((yaxis, bx), (yaxis2, dx)):
+                axis.update(domain=domain[1], anchor=ref)
+        scaleratio = (
+            self._background_coordinates.aspect_ratio
+            / self._coordinates.aspect_ratio
+        )
+        if self._vertical:
+            xaxis.update(scaleanchor=by, scaleratio=1)
+            xaxis2.update(scaleanchor=dy, scaleratio=scaleratio)
+        else:
+            yaxis.update(scaleanchor=bx, scaleratio=1)
+            yaxis2.update(scaleanchor=dx, scaleratio=scaleratio)
+        return {
+            _axis_key(bx): xaxis,
+            _axis_key(by): yaxis,
+            _axis_key(dx): xaxis2,
+            _axis_key(dy): yaxis2,
+        }
+
+    def _layout(
+        self,
+        fig_length: int | float | None,
+        fig_width: int | float | None,
+    ) -> dict[str, Any]:
+        fig_length, fig_width = self._calc_fig_size(fig_length, fig_width)
+        return dict(
+            **self._axes(),
+            paper_bgcolor=self.theme.background,
+            width=fig_length,
+            height=fig_width,
+            **self._output_animation_controls(),
+        )
+
+    def _output_animation_controls(self) -> dict[str, Any]:
+        controls: dict[str, Any] = _copy(self._animation_controls)
+        if controls and self._use_webgl():
+            # WebGL traces only update when plotly redraws, so frames would
+            # otherwise freeze on the first one.
+            buttons = controls["updatemenus"][0]["buttons"]
+            steps = controls["sliders"][0]["steps"]
+            for item in (*buttons, *steps):
+                item["args"][1]["frame"]["redraw"] = True
+        return controls
+
+    def _render(
+        self,
+        fig_length: int | float | None = None,
+        fig_width: int | float | None = None,
+    ) -> None:
+        self._draw_background()
+        self._draw_layers()
+        layout = self._layout(fig_length, fig_width)
+        if layout != self._rendered_layout:
+            self._figure().update_layout(**layout)
+            self._rendered_layout = layout
+        self._draw_template()
+
+    def _draw_template(self) -> None:
+        template = self._template()
+        if template is not self._rendered_template:
+            # The template is derived from plotly's own, already validated
+            # one, so it is assigned the way plotly assigns its default
+            # template: without validating it again, which would cost more
+            # than drawing the whole pitch. Plotly keeps the assigned dict,
+            # so it gets a copy of the cached one.
+            fig = self._figure()
+            fig._layout_obj._validate = False
+            try:
+                fig.layout.template = _copy(template)
+            finally:
+                fig._layout_obj._validate = fig._validate
+            self._rendered_template = template
+
     def show(
         self,
         fig_length: int | float | None = None,
         fig_width: int | float | None = None,
     ) -> None:
-        fig_length, fig_width = self._calc_fig_size(fig_length, fig_width)
+        self._render(fig_length, fig_width)
+        self._figure().show()
+
+    def to_dict(
+        self,
+        fig_length: int | float | None = None,
+        fig_width: int | float | None = None,
+    ) -> dict[str, Any]:
+        # Once the figure has been materialised it may have been edited
+        # directly, so it stays the source of truth.
+        if self._fig is not None:
+            self._render(fig_length, fig_width)
+            return self._fig.to_dict()  # type: ignore[no-any-return]
 
-        axis: dict[str, Any] = dict(
-            xaxis=dict(
-                range=self._extend_axis_range(
+        fig_dict: dict[str, Any] = {
+            "data": self._output_traces(self._traces, self._use_webgl()),
+            "layout": {
+                **self._layout(fig_length, fig_width),
+                "shapes": _copy(list(self._background_shapes())),
+                "images": self._output_images(self._images),
+                "annotations": self._output_annotations(self._annotations),
+                "template": _copy(self._template()),
+            },
+        }
+        if self._frames:
+            fig_dict["frames"] = _copy(self._frames)
+        if self._validate:
+            return self._validated_dict(fig_dict)
+        return fig_dict
+
+    def _validated_dict(self, fig_dict: dict[str, Any]) -> dict[str, Any]:
+        import plotly.graph_objects as go
+
+        return go.Figure(fig_dict).to_dict()  # type: ignore[no-any-return]
+
+    def to_json(
+        self,
+        fig_length: int | float | None = None,
+        fig_width: int | float | None = None,
+    ) -> str:
+        import plotly.io as pio
+
+        payload: str = pio.to_json(
+            self.to_dict(fig_length, fig_width), validate=False
+        )
+        if self._recorder is not None:
+            self._recorder.record_payload(len(payload.encode()))
+        return payload
+
+    def write_html(
+        self,
+        file: Path | str,
+        fig_length: int | float | None = None,
+        fig_width: int | float | None = None,
+        *,
+        include_plotlyjs: bool | str = "cdn",
+        full_html: bool = True,
+    ) -> None:
+        import plotly.io as pio
+
+        pio.write_html(
+            self.to_dict(fig_length, fig_width),
+            file,
+            validate=False,
+            include_plotlyjs=include_plotlyjs,
+            full_html=full_html,
+        )
+        if self._recorder is not None and isinstance(file, (str, Path)):
+            self._recorder.record_payload(Path(file).stat().st_size)
+
+    def to_svg(
+        self,
+        fig_length: int | float | None = None,
+        fig_width: int | float | None = None,
+    ) -> str:
+        # Drawn straight from the layers, without plotly. Only the current
+        # state is drawn: animation frames are ignored.
+        fig_length, fig_width = self._calc_fig_size(fig_length, fig_width)
+        return render_svg(
+            fig_length,
+            fig_width,
+            background_range=(
+                self._extend_axis_range(
                     self._background_coordinates.xaxis_range
                 ),
-                showgrid=False,
-                zeroline=False,
-                showticklabels=False,
-            ),
-            yaxis=dict(
-                range=self._extend_axis_range(
+                self._extend_axis_range(
                     self._background_coordinates.yaxis_range
                 ),
-                showgrid=False,
-                zeroline=False,
-                showticklabels=False,
-            ),
-            xaxis2=dict(
-                range=self._extend_axis_range(self._coordinates.xaxis_range),
-                showgrid=False,
-                zeroline=False,
-                overlaying="x",
             ),
-            yaxis2=dict(
-                range=self._extend_axis_range(self._coordinates.yaxis_range),
-                showgrid=False,
-                zeroline=False,
-                overlaying="y",
+            data_range=(
+                self._extend_axis_range(self._coordinates.xaxis_range),
+                self._extend_axis_range(self._coordinates.yaxis_range),
             ),
+            shapes=self._background_shapes(),
+            traces=self._traces,
+            images=self._images,
+            annotations=self._annotations,
+            theme=self.theme,
         )
-        if self._vertical:
-            axis["xaxis"]["scaleanchor"] = "y"
-            axis["xaxis"]["scaleratio"] = 1
-            axis["xaxis2"]["scaleanchor"] = "y2"
-            axis["xaxis2"]["scaleratio"] = (
-                self._background_coordinates.aspect_ratio
-                / self._coordinates.aspect_ratio
-            )
-        else:
-            axis["yaxis"]["scaleanchor"] = "x"
-            axis["yaxis"]["scaleratio"] = 1
-            axis["yaxis2"]["scaleanchor"] = "x2"
-            axis["yaxis2"]["scaleratio"] = (
-                self._background_coordinates.aspect_ratio
-                / self._coordinates.aspect_ratio
-            )
 
-        self._draw_background()
-        self.fig.update_layout(
-            **axis,
-            paper_bgcolor=self.theme.background,
-            width=fig_length,
-            height=fig_width,
+    def write_svg(
+        self,
+        file: Path | str,
+        fig_length: int | float | None = None,
+        fig_width: int | float | None = None,
+    ) -> None:
+        Path(file).write_text(
+            self.to_svg(fig_length, fig_width), encoding="utf-8"
         )
-
-        self.fig.show()
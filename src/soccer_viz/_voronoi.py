@@ -0,0 +1,210 @@
+from collections.abc import Iterable
+from functools import lru_cache
+from itertools import combinations, repeat
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+Bounds = tuple[float, float, float, float]
+Cells = list[NDArray[np.float64]]
+
+
+@lru_cache(maxsize=None)
+def _combinations(n: int, r: int) -> NDArray[np.intp]:
+    return np.array(list(combinations(range(n), r)), dtype=np.intp).reshape(
+        -1, r
+    )
+
+
+def _candidates(
+    p: NDArray[np.float64], bounds: Bounds
+) -> tuple[NDArray[np.float64], NDArray[np.intp]]:
+    # Every vertex of the clipped diagram is the circumcentre of three
+    # sites, the crossing of a bisector with a pitch edge, or a corner.
+    # Each candidate comes with one of the sites it is equidistant from,
+    # or -1 for corners.
+    n_frames, n, _ = p.shape
+    x0, y0, x1, y1 = bounds
+    i, j, k = _combinations(n, 3).T
+    a, b, c = p[:, i], p[:, j], p[:, k]
+    sa, sb, sc = (a**2).sum(axis=2), (b**2).sum(axis=2), (c**2).sum(axis=2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d = 2 * (
+            a[..., 0] * (b[..., 1] - c[..., 1])
+            + b[..., 0] * (c[..., 1] - a[..., 1])
+            + c[..., 0] * (a[..., 1] - b[..., 1])
+        )
+        centres = np.stack(
+            [
+                (
+                    sa * (b[..., 1] - c[..., 1])
+                    + sb * (c[..., 1] - a[..., 1])
+                    + sc * (a[..., 1] - b[..., 1])
+                )
+                / d,
+                (
+                    sa * (c[..., 0] - b[..., 0])
+                    + sb * (a[..., 0] - c[..., 0])
+                    + sc * (b[..., 0] - a[..., 0])
+                )
+                / d,
+            ],
+            axis=2,
+        )
+
+        # Bisector of sites u and v: (v - u) . x = (|v|^2 - |u|^2) / 2.
+        u, v = _combinations(n, 2).T
+        normal = p[:, v] - p[:, u]
+        offset = ((p[:, v] ** 2).sum(axis=2) - (p[:, u] ** 2).sum(axis=2)) / 2
+        crossings = []
+        for edge in (x0, x1):
+            along = (offset - normal[..., 0] * edge) / normal[..., 1]
+            crossings.append(
+                np.stack([np.full_like(along, edge), along], axis=2)
+            )
+        for edge in (y0, y1):
+            along = (offset - normal[..., 1] * edge) / normal[..., 0]
+            crossings.append(
+                np.stack([along, np.full_like(along, edge)], axis=2)
+            )
+
+    corners = np.broadcast_to(
+        [[x0, y0], [x0, y1], [x1, y0], [x1, y1]], (n_frames, 4, 2)
+    )
+    vertices = np.concatenate([centres, *crossings, corners], axis=1)
+    owners = np.concatenate([i, np.tile(u, 4), np.full(4, -1)])
+    return vertices, owners
+
+
+def _batch_cells(
+    positions: NDArray[np.float64], bounds: Bounds
+) -> list[Cells]:
+    n_frames, n, _ = positions.shape
+    if n == 0:
+        return [[] for _ in range(n_frames)]
+    x0, y0, x1, y1 = bounds
+    scale = max(abs(x1 - x0), abs(y1 - y0), 1.0)
+    tolerance = 1e-9 * scale**2
+    distance = np.sqrt(tolerance)
+
+    vertices, owners = _candidates(positions, bounds)
+    # A candidate is a vertex when it lies on the pitch and the sites that
+    # define it are among its nearest; it then belongs to the cell of
+    # every nearest site. Most candidates fall off the pitch, so distances
+    # are only measured for the rest.
+    vx, vy = vertices[..., 0], vertices[..., 1]
+    f, v = np.nonzero(
+        (vx >= min(x0, x1) - distance)
+        & (vx <= max(x0, x1) + distance)
+        & (vy >= min(y0, y1) - distance)
+        & (vy <= max(y0, y1) + distance)
+    )
+    points = vertices[f, v]
+    dx = points[:, None, 0] - positions[f, :, 0]
+    dy = points[:, None, 1] - positions[f, :, 1]
+    squared = dx * dx + dy * dy
+    squared[np.isnan(squared)] = np.inf
+    nearest = squared.min(axis=1, initial=np.inf)
+    owner = owners[v]
+    owned = squared[np.arange(len(v)), np.maximum(owner, 0)]
+    kept = (owner < 0) | (owned <= nearest + tolerance)
+    s, i = np.nonzero(
+        kept[:, None] & (squared <= nearest[:, None] + tolerance)
+    )
+    points = points[s]
+    cell = f[s] * n + i
+
+    # Order each cell's vertices by angle around their mean, which lies
+    # inside the convex cell, and drop repeats where several sites meet.
+    size = n_frames * n
+    counts = np.bincount(cell, minlength=size)
+    centre = (
+        np.stack(
+            [
+                np.bincount(cell, points[:, 0], size),
+                np.bincount(cell, points[:, 1], size),
+            ],
+            axis=1,
+        )
+        / np.maximum(counts, 1)[:, None]
+    )
+    offset = points - centre[cell]
+    order = np.lexsort((np.arctan2(offset[:, 1], offset[:, 0]), cell))
+    points, cell = points[order], cell[order]
+    repeat = np.zeros(len(cell), dtype=bool)
+    repeat[1:] = (cell[1:] == cell[:-1]) & (
+        np.abs(np.diff(points, axis=0)).max(axis=1) <= distance
+    )
+    points, cell = points[~repeat], cell[~repeat]
+    # The first and last vertex of a cell can also coincide, on either
+    # side of the angle wrap-around.
+    counts = np.bincount(cell, minlength=size)
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    wrapped = (counts > 1) & (
+        np.abs(
+            points[np.minimum(starts, len(points) - 1)]
+            - points[np.maximum(ends - 1, 0)]
+        ).max(axis=1, initial=0)
+        <= distance
+    )
+    drop = np.zeros(len(cell), dtype=bool)
+    drop[ends[wrapped] - 1] = True
+    points = points[~drop]
+    counts -= wrapped
+
+    cells = np.split(points, np.cumsum(counts)[:-1])
+    return [cells[f * n : (f + 1) * n] for f in range(n_frames)]
+
+
+def voronoi_frames(
+    positions: ArrayLike,
+    bounds: Bounds,
+    *,
+    workers: int = 1,
+    batch_size: int = 16,
+) -> list[Cells]:
+    frames = np.asarray(positions, dtype=np.float64)
+    if frames.ndim != 3 or frames.shape[2] != 2:
+        raise ValueError(
+            f"Invalid positions: expected (frames, players, 2), "
+            f"got {frames.shape}."
+        )
+    if workers < 1:
+        raise ValueError(f"Invalid workers: {workers}. Expected >= 1.")
+    if batch_size < 1:
+        raise ValueError(f"Invalid batch_size: {batch_size}. Expected >= 1.")
+    if len(frames) == 0:
+        return []
+
+    # A frame identical to the one before it, e.g. during a stoppage,
+    # reuses that frame's cells instead of being solved again.
+    repeated = np.zeros(len(frames), dtype=bool)
+    repeated[1:] = (
+        (frames[1:] == frames[:-1])
+        | (np.isnan(frames[1:]) & np.isnan(frames[:-1]))
+    ).all(axis=(1, 2))
+    unique = frames[~repeated]
+    batches = [
+        unique[i : i + batch_size] for i in range(0, len(unique), batch_size)
+    ]
+
+    results: Iterable[list[Cells]]
+    if workers > 1 and len(batches) > 1:
+        # Imported here, as multiprocessing is slow to import and most
+        # callers never need it.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    _batch_cells,
+                    batches,
+                    repeat(bounds),
+                    chunksize=max(1, len(batches) // (workers * 4)),
+                )
+            )
+    else:
+        results = map(_batch_cells, batches, repeat(bounds))
+    solved = [cells for batch in results for cells in batch]
+    return [solved[i] for i in np.cumsum(~repeated) - 1]
@@ -0,0 +1,91 @@
+from pathlib import Path
+
+import pytest
+
+from soccer_viz import DefaultTheme, Pitch, PitchSpec, render_many
+from soccer_viz._batch import _warm_up_args
+
+
+def _specs(n: int) -> list[PitchSpec]:
+    return [
+        {
+            "pitch": {"vertical": i % 2 == 1},
+            "layers": [("add_points", {"x": [i, 50], "y": [i, 50]})],
+        }
+        for i in range(n)
+    ]
+
+
+def test_render_many() -> None:
+    specs = _specs(5)
+    results = sorted(render_many(specs, workers=1), key=lambda r: r["index"])
+    assert [r["index"] for r in results] == list(range(5))
+    assert all(r["error"] is None for r in results)
+
+    pitch = Pitch(vertical=True)
+    pitch.add_points(x=[3, 50], y=[3, 50])
+    assert results[3]["output"] == pitch.to_svg()
+
+
+def test_render_many_errors() -> None:
+    specs = _specs(3)
+    specs[1] = {"layers": [("to_json", {})]}
+    specs[2] = {"layers": [("add_points", {"x": [1], "y": []})]}
+    results = sorted(render_many(specs, workers=1), key=lambda r: r["index"])
+    assert results[0]["error"] is None
+    assert results[1]["output"] is None
+    assert results[1]["error"] == (
+        "ValueError: Invalid layer: 'to_json'. Expected an add_*."
+    )
+    assert results[2]["error"] is not None
+    assert results[2]["error"].startswith("ValueError: Invalid y")
+
+
+def test_render_many_workers(tmp_path: Path) -> None:
+    specs = _specs(10)
+    specs[4]["path"] = tmp_path / "4.json"
+    specs[6] = {"pitch": {"side": "middle"}}
+    results = {
+        r["index"]: r
+        for r in render_many(specs, format="json", workers=2, chunksize=3)
+    }
+    assert sorted(results) == list(range(10))
+    assert results[4]["output"] == str(tmp_path / "4.json")
+    assert (tmp_path / "4.json").read_text().startswith("{")
+    assert results[6]["error"] is not None
+    assert results[7]["output"] is not None
+    assert results[7]["output"].startswith("{")
+
+
+def test_render_many_unpicklable() -> None:
+    specs = _specs(4)
+    specs[2]["pitch"] = {"theme": lambda: None}
+    results = {
+        r["index"]: r for r in render_many(specs, workers=2, chunksize=2)
+    }
+    assert sorted(results) == list(range(4))
+    assert results[2]["output"] is None
+    assert results[2]["error"] is not None
+    assert results[2]["error"].startswith(("PicklingError", "AttributeError"))
+    # Its chunk neighbour is still rendered.
+    assert results[3]["error"] is None
+
+
+def test_warm_up_args() -> None:
+    specs: list[PitchSpec] = [
+        {"pitch": {"theme": DefaultTheme("dark")}} for _ in range(100)
+    ]
+    specs += _specs(4)
+    specs.append({"pitch": {"theme": lambda: None}})
+    pitches, images = _warm_up_args(specs)
+    assert [pitch.get("vertical") for pitch in pitches] == [None, False, True]
+    assert images == []
+
+
+def test_render_many_invalid() -> None:
+    with pytest.raises(ValueError, match="Invalid workers"):
+        render_many([], workers=0)
+    with pytest.raises(ValueError, match="Invalid chunksize"):
+        render_many([], chunksize=0)
+    with pytest.raises(ValueError, match="Invalid format"):
+        render_many([], format="png")  # type: ignore[arg-type]
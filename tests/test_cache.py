@@ -0,0 +1,35 @@
+import pytest
+
+from soccer_viz._cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("b") is None
+
+
+def test_lru_cache_get_or_create() -> None:
+    cache: LRUCache[str, list[int]] = LRUCache()
+    calls = []
+
+    def factory() -> list[int]:
+        calls.append(1)
+        return [1, 2, 3]
+
+    first = cache.get_or_create("key", factory)
+    second = cache.get_or_create("key", factory)
+    assert first is second
+    assert len(calls) == 1
+
+
+def test_lru_cache_invalid_maxsize() -> None:
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
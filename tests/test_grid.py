@@ -0,0 +1,70 @@
+import plotly.graph_objects as go
+import pytest
+
+from soccer_viz import DefaultTheme, Pitch, PitchGrid
+
+
+def _pitches(n: int) -> list[Pitch]:
+    pitches = []
+    for i in range(n):
+        pitch = Pitch(vertical=i % 2 == 1)
+        pitch.add_point(x=i, y=i)
+        pitch.add_annotation(start_x=0, start_y=0, end_x=i, end_y=i)
+        pitches.append(pitch)
+    return pitches
+
+
+def test_pitch_grid_layout() -> None:
+    grid = PitchGrid(_pitches(5), titles=list("abcde"))
+    assert len(grid) == 5
+    fig_dict = grid.to_dict()
+    layout = fig_dict["layout"]
+
+    # Three columns and two rows, two axis pairs per cell.
+    assert layout["xaxis10"]["overlaying"] == "x9"
+    assert layout["yaxis10"]["anchor"] == "x10"
+    assert "xaxis11" not in layout
+    assert layout["xaxis"]["domain"] == pytest.approx((0.01, 1 / 3 - 0.01))
+    assert layout["yaxis3"]["domain"] == pytest.approx((0.51, 0.99))
+    assert layout["width"] == 3 * 320
+
+    traces = fig_dict["data"]
+    assert [(t["xaxis"], t["yaxis"]) for t in traces] == [
+        (f"x{2 * i + 2}", f"y{2 * i + 2}") for i in range(5)
+    ]
+    arrows = [a for a in layout["annotations"] if "axref" in a]
+    assert arrows[4]["xref"] == arrows[4]["axref"] == "x10"
+    assert [a["text"] for a in layout["annotations"] if "text" in a] == list(
+        "abcde"
+    )
+
+
+def test_pitch_grid_shares_backgrounds() -> None:
+    pitches = _pitches(4)
+    grid = PitchGrid(pitches, validate=False)
+    shapes = grid.to_dict()["layout"]["shapes"]
+    per_pitch = len(pitches[0]._background_shapes())
+    assert len(shapes) == 4 * per_pitch
+    assert {shape["xref"] for shape in shapes[:per_pitch]} == {"x"}
+    assert {shape["xref"] for shape in shapes[-per_pitch:]} == {"x7"}
+    # Output never shares the cached shapes.
+    shapes[-1]["line"]["color"] = "red"
+    assert grid.to_dict()["layout"]["shapes"][-1]["line"]["color"] != "red"
+    assert isinstance(grid.fig, go.Figure)
+
+
+def test_pitch_grid_invalid() -> None:
+    with pytest.raises(ValueError, match="Invalid pitches"):
+        PitchGrid([])
+    with pytest.raises(ValueError, match="Invalid cols"):
+        PitchGrid(_pitches(2), cols=0)
+    with pytest.raises(ValueError, match="Invalid titles"):
+        PitchGrid(_pitches(2), titles=["a"])
+    with pytest.raises(ValueError, match="Invalid spacing"):
+        PitchGrid(_pitches(4), spacing=0.5)
+
+
+def test_pitch_grid_theme() -> None:
+    pitch = Pitch(theme=DefaultTheme("dark"))
+    layout = PitchGrid([pitch]).to_dict()["layout"]
+    assert layout["paper_bgcolor"] == pitch.theme.background
@@ -0,0 +1,79 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+LAZY_IMPORT = """
+import sys
+
+import soccer_viz
+
+pitch = soccer_viz.Pitch()
+pitch.coordinates.left_penalty_area()
+pitch.add_point(x=10, y=20, number=7)
+pitch.add_line(start_x=10, start_y=20, end_x=30, end_y=40, gradient=True)
+assert "plotly" not in sys.modules, "plotly imported eagerly"
+
+pitch.fig
+assert "plotly" in sys.modules
+"""
+
+# Modules only needed by figures, streams or worker pools.
+HEAVY_MODULES = """
+import sys
+
+import {module}
+
+heavy = {{"plotly", "asyncio", "multiprocessing", "concurrent.futures"}}
+assert not heavy & sys.modules.keys(), sorted(heavy & sys.modules.keys())
+"""
+
+IMPORT_TIME = """
+import time
+
+start = time.perf_counter()
+import numpy
+middle = time.perf_counter()
+import soccer_viz
+end = time.perf_counter()
+print(middle - start, end - middle)
+"""
+
+
+def test_plotly_imported_lazily() -> None:
+    subprocess.run([sys.executable, "-c", LAZY_IMPORT], check=True)
+
+
+def test_heavy_modules_imported_lazily() -> None:
+    for module in ("soccer_viz", "soccer_viz._models"):
+        subprocess.run(
+            [sys.executable, "-c", HEAVY_MODULES.format(module=module)],
+            check=True,
+        )
+
+
+def test_import_time(tmp_path: Path) -> None:
+    # numpy is the only heavy dependency imported eagerly, so the package
+    # itself must load in a fraction of its time. Bytecode is cached as it
+    # would be once installed; the first run only writes it.
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key != "PYTHONDONTWRITEBYTECODE"
+    }
+    command = [
+        sys.executable,
+        "-X",
+        f"pycache_prefix={tmp_path}",
+        "-c",
+        IMPORT_TIME,
+    ]
+    runs = []
+    for _ in range(4):
+        stdout = subprocess.run(
+            command, check=True, capture_output=True, text=True, env=env
+        ).stdout
+        numpy_time, own_time = map(float, stdout.split())
+        runs.append((own_time, numpy_time))
+    own_time, numpy_time = min(runs[1:])
+    assert own_time < numpy_time / 2, (own_time, numpy_time)
@@ -0,0 +1,58 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from soccer_viz import LiveEvent, LivePitch, Pitch
+
+pytest.importorskip("anywidget")
+
+
+def test_flush_batches_pending_events() -> None:
+    live = LivePitch(Pitch())
+    live.push(x=10, y=20, text="A")
+    live.push(x=30, y=40, color="#123456", size=5)
+    assert live.pending == 2
+
+    live.flush()
+    live.flush()
+    assert live.pending == 0
+    assert live._updates == 1
+
+    trace = live.widget.data[-1]
+    assert trace.x == (10, 30)
+    assert trace.text == ("A", "")
+    assert trace.marker.color == (live.pitch.theme.home_team, "#123456")
+    assert trace.marker.size == (10, 5)
+
+
+def test_max_points_keeps_latest_events() -> None:
+    live = LivePitch(Pitch(), max_points=2)
+    for x in range(5):
+        live.push(x=x, y=x)
+    live.flush()
+    assert live.widget.data[-1].x == (3, 4)
+
+
+def test_consume_rate_limits_updates() -> None:
+    async def events() -> AsyncIterator[LiveEvent]:
+        for i in range(500):
+            yield LiveEvent(x=i % 105, y=i % 68)
+            if i % 50 == 0:
+                await asyncio.sleep(0.01)
+
+    live = LivePitch(Pitch(), max_fps=20)
+    asyncio.run(live.consume(events()))
+    assert len(live.widget.data[-1].x) == 500
+    assert live._updates < 10
+
+
+def test_invalid_max_fps() -> None:
+    with pytest.raises(ValueError):
+        LivePitch(Pitch(), max_fps=0)
+
+
+@pytest.mark.parametrize("max_points", [0, -1])
+def test_invalid_max_points(max_points: int) -> None:
+    with pytest.raises(ValueError, match="Invalid max_points"):
+        LivePitch(Pitch(), max_points=max_points)
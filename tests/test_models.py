@@ -1,3 +1,4 @@
+import pickle
 from typing import Literal
 
 import pytest
@@ -52,6 +53,29 @@ def test_pitch_markings_equality() -> None:
     assert markings1 != markings3
 
 
+def test_pitch_markings_hashable() -> None:
+    markings1 = PitchMarkings(center_circle_radius=0.1 + 0.2)
+    markings2 = PitchMarkings(center_circle_radius=0.3)
+    assert hash(markings1) == hash(markings2)
+    assert len({markings1, markings2, PitchMarkings()}) == 2
+
+
+def test_pitch_markings_immutable() -> None:
+    markings = PitchMarkings()
+    with pytest.raises(AttributeError):
+        markings.touch_line = 120
+    with pytest.raises(AttributeError):
+        markings.extra = 1
+
+
+def test_pitch_markings_pickle() -> None:
+    markings = PitchMarkings(touch_line=120, goal_line=80, use_standard=False)
+    restored = pickle.loads(pickle.dumps(markings))
+    assert restored == markings
+    assert restored.center_circle_radius == markings.center_circle_radius
+    assert scale_100(restored.aspect_ratio) == scale_100(80 / 120)
+
+
 class TestStandardCoordinates:
     @pytest.fixture(scope="class")
     def coordinates(self) -> PitchCoordinates:
@@ -403,3 +427,112 @@ class TestBackgroundPitchCoordinates:
         assert coordinates.xaxis_end == 105
         assert coordinates.yaxis_start == 0
         assert coordinates.yaxis_end == 68
+
+
+@pytest.mark.parametrize(
+    "provider, x, y",
+    [
+        ("opta", [0, 50, 100], [0, 50, 100]),
+        ("wyscout", [0, 50, 100], [100, 50, 0]),
+        ("statsbomb", [0, 60, 120], [80, 40, 0]),
+        ("secondspectrum", [-52.5, 0, 52.5], [-34, 0, 34]),
+        (((0, 1), (0, 1)), [0, 0.5, 1], [0, 0.5, 1]),
+    ],
+)
+def test_transform_providers(
+    provider: str | tuple[tuple[float, float], tuple[float, float]],
+    x: list[float],
+    y: list[float],
+) -> None:
+    coordinates = PitchCoordinates(markings=PitchMarkings())
+    xs, ys = coordinates.transform(x, y, provider=provider)
+    assert [scale_100(value) for value in xs] == [0, 5250, 10500]
+    assert [scale_100(value) for value in ys] == [0, 3400, 6800]
+
+
+def test_transform_vertical_custom_ranges() -> None:
+    coordinates = PitchCoordinates(
+        markings=PitchMarkings(),
+        touch_line_range=(105, 0),
+        goal_line_range=(-34, 34),
+        vertical=True,
+        side="left",
+    )
+    xs, ys = coordinates.transform([25], [75], provider="opta")
+    assert scale_100(xs[0]) == scale_100(17)
+    assert scale_100(ys[0]) == scale_100(78.75)
+
+
+def test_transform_invalid_provider() -> None:
+    coordinates = PitchCoordinates(markings=PitchMarkings())
+    with pytest.raises(ValueError):
+        coordinates.transform([0], [0], provider="unknown")
+
+
+class TestRegions:
+    @pytest.fixture(scope="class")
+    def coordinates(self) -> PitchCoordinates:
+        return PitchCoordinates(markings=PitchMarkings())
+
+    def test_regions(self, coordinates: PitchCoordinates) -> None:
+        regions = coordinates.regions(
+            [3, 10, 20, 52.5, 60, 104, 95, -1],
+            [34, 34, 34, 34, 2, 34, 34, 5],
+        )
+        assert list(regions) == [
+            "left_goal_area",
+            "left_penalty_area",
+            "left_penalty_arc",
+            "centre_circle",
+            "pitch",
+            "right_goal_area",
+            "right_penalty_area",
+            "outside",
+        ]
+
+    def test_area_masks(self, coordinates: PitchCoordinates) -> None:
+        masks = coordinates.area_masks([3, 20], [34, 34])
+        assert list(masks["left_goal_area"]) == [True, False]
+        assert list(masks["left_penalty_area"]) == [True, False]
+        assert list(masks["left_penalty_arc"]) == [False, True]
+        assert list(masks["pitch"]) == [True, True]
+
+    def test_thirds(self, coordinates: PitchCoordinates) -> None:
+        thirds = coordinates.thirds([0, 40, 105, 106], [1, 1, 1, 1])
+        assert list(thirds) == [0, 1, 2, -1]
+
+    def test_channels(self, coordinates: PitchCoordinates) -> None:
+        channels = coordinates.channels([1] * 7, [0, 14, 20, 34, 50, 68, 69])
+        assert list(channels) == [0, 1, 1, 2, 3, 4, -1]
+
+
+def test_regions_custom_vertical_ranges() -> None:
+    coordinates = PitchCoordinates(
+        markings=PitchMarkings(),
+        touch_line_range=(-52.5, 52.5),
+        goal_line_range=(-34, 34),
+        vertical=True,
+    )
+    regions = coordinates.regions([0, 0, 0], [-50, 0, 50])
+    assert list(regions) == [
+        "left_goal_area",
+        "centre_circle",
+        "right_goal_area",
+    ]
+
+
+def test_dominant_regions() -> None:
+    coordinates = PitchCoordinates(
+        markings=PitchMarkings(),
+        touch_line_range=(0, 100),
+        goal_line_range=(0, 100),
+        vertical=True,
+    )
+    # On a 100 x 100 provider grid a vertical pitch swaps the axes, and the
+    # regions are split by the perpendicular bisector in metres.
+    (regions,) = coordinates.dominant_regions([(50, 20), (50, 80)])
+    lower, upper = regions
+    assert lower[:, 1].max() == pytest.approx(50)
+    assert upper[:, 1].min() == pytest.approx(50)
+    assert lower[:, 0].min() == pytest.approx(0)
+    assert lower[:, 0].max() == pytest.approx(100)
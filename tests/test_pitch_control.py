@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from soccer_viz import PitchControl
+
+RNG = np.random.default_rng(0)
+HOME = RNG.uniform((0, 0), (105, 68), (40, 11, 2))
+AWAY = RNG.uniform((0, 0), (105, 68), (40, 11, 2))
+
+
+def test_evaluate_shape_and_range() -> None:
+    model = PitchControl(grid=(21, 14))
+    control = model.evaluate(HOME, AWAY, batch_size=7)
+    assert control.shape == (40, 14, 21)
+    assert np.all((control >= 0) & (control <= 1))
+    assert model.x[0] == pytest.approx(2.5)
+    assert model.y[-1] == pytest.approx(68 - 68 / 28)
+
+    # Swapping the teams mirrors the control.
+    swapped = PitchControl(grid=(21, 14)).evaluate(AWAY, HOME)
+    np.testing.assert_allclose(control, 1 - swapped, atol=1e-12)
+
+
+def test_evaluate_single_player() -> None:
+    model = PitchControl(grid=(2, 1))
+    control = model.evaluate([[10, 34]], [[95, 34]])
+    assert control.shape == (1, 1, 2)
+    assert control[0, 0, 0] > 0.99
+    assert control[0, 0, 1] < 0.01
+
+    # A missing player never arrives.
+    control = model.evaluate([[np.nan, np.nan]], [[95, 34]])
+    assert np.all(control == 0)
+
+
+def test_evaluate_velocities() -> None:
+    model = PitchControl(grid=(2, 1))
+    still = model.evaluate([[52.5, 34]], [[52.5, 34]])
+    np.testing.assert_allclose(still, 0.5)
+    moving = model.evaluate(
+        [[52.5, 34]], [[52.5, 34]], home_velocities=[[5, 0]]
+    )
+    assert moving[0, 0, 0] < 0.5 < moving[0, 0, 1]
+
+
+def test_evaluate_cache() -> None:
+    model = PitchControl(grid=(21, 14))
+    control = model.evaluate(HOME, AWAY)
+    assert model.evaluate(HOME.copy(), AWAY.copy()) is control
+    assert not control.flags.writeable
+
+
+def test_evaluate_workers() -> None:
+    serial = PitchControl(grid=(21, 14)).evaluate(HOME, AWAY, batch_size=8)
+    parallel = PitchControl(grid=(21, 14)).evaluate(
+        HOME, AWAY, workers=2, batch_size=8
+    )
+    np.testing.assert_array_equal(serial, parallel)
+
+
+def test_invalid() -> None:
+    with pytest.raises(ValueError, match="Invalid grid"):
+        PitchControl(grid=(0, 10))
+    with pytest.raises(ValueError, match="Invalid sigma"):
+        PitchControl(sigma=0)
+    model = PitchControl()
+    with pytest.raises(ValueError, match="Invalid home"):
+        model.evaluate([1, 2], AWAY)
+    with pytest.raises(ValueError, match="Invalid away"):
+        model.evaluate(HOME, AWAY[:3])
+    with pytest.raises(ValueError, match="Invalid home_velocities"):
+        model.evaluate(HOME, AWAY, home_velocities=HOME[:3])
+    with pytest.raises(ValueError, match="Invalid workers"):
+        model.evaluate(HOME, AWAY, workers=0)
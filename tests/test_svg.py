@@ -0,0 +1,107 @@
+import re
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from soccer_viz import DefaultTheme, Pitch
+from soccer_viz._svg import _parse_color, _scale_colors
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def _points(svg: str) -> list[float]:
+    return [
+        float(value)
+        for point in re.findall(r"M([-\d.]+) ([-\d.]+)h0", svg)
+        for value in point
+    ]
+
+
+def test_to_svg_background() -> None:
+    pitch = Pitch(theme=DefaultTheme("dark"))
+    root = ET.fromstring(pitch.to_svg(800))
+    assert root.get("width") == "800"
+    shapes = [
+        element
+        for element in root
+        if element.tag in (f"{SVG}rect", f"{SVG}ellipse", f"{SVG}line")
+    ]
+    # The paper, then every background shape.
+    assert len(shapes) == 1 + len(pitch._background_shapes())
+    assert shapes[0].get("fill") == pitch.theme.background
+    assert shapes[1].get("stroke") == pitch.theme.border
+
+
+@pytest.mark.parametrize(
+    "pitch",
+    [
+        Pitch(),
+        Pitch(vertical=True),
+        Pitch(side="left"),
+        Pitch(touch_line_range=(-52.5, 52.5), goal_line_range=(-34, 34)),
+    ],
+)
+def test_to_svg_data_aligned_with_markings(pitch: Pitch) -> None:
+    (x0, x1), (y0, y1) = pitch.xaxis_range, pitch.yaxis_range
+    pitch.add_points([x0, x1], [y0, y1])
+    svg = pitch.to_svg()
+    area = ET.fromstring(svg)[1]
+    left, top = float(area.get("x", 0)), float(area.get("y", 0))
+    right = left + float(area.get("width", 0))
+    bottom = top + float(area.get("height", 0))
+    assert _points(svg) == pytest.approx([left, bottom, right, top], abs=0.11)
+
+
+def test_to_svg_layers(tmp_path: Path) -> None:
+    pitch = Pitch()
+    pitch.add_points(
+        [10, 20, 30],
+        [10, 20, 30],
+        color=["red", "red", "blue"],
+        text=["a", "b", "<c>"],
+        number=[1, None, 3],
+    )
+    pitch.add_point(50, 50, symbol="triangle-up")
+    pitch.add_lines([0, 10], [0, 10], [50, 60], [50, 60], dash="dash")
+    pitch.add_polygons([[(0, 0), (10, 0), (10, 10)]], color="#123456")
+    pitch.add_annotation(0, 0, 50, 50, color="#abcdef")
+    pitch.add_heatmap([10, 10, 60], [10, 10, 60], bins=2)
+    svg = pitch.to_svg()
+    root = ET.fromstring(svg)
+
+    # Markers of one style share a path.
+    assert len(_points(svg)) == 2 * 3
+    assert svg.count('stroke="red"') == 1
+    texts = [element.text for element in root.iter(f"{SVG}text")]
+    assert texts == ["a", "b", "<c>", "1", "3"]
+    assert "stroke-dasharray" in svg
+    assert 'fill="#123456"' in svg
+    assert 'stroke="#abcdef"' in svg
+    # Empty bins are transparent and left out.
+    heatmap = [
+        element
+        for element in root.iter(f"{SVG}path")
+        if element.get("d", "").endswith("Z") and "h" in element.get("d", "")
+    ]
+    assert sum(element.get("d", "").count("Z") for element in heatmap) == 2
+
+    path = tmp_path / "pitch.svg"
+    pitch.write_svg(path)
+    assert path.read_text() == svg
+
+
+def test_scale_colors() -> None:
+    assert _parse_color("#fff") == (255, 255, 255, 1)
+    assert _parse_color("rgba(0, 0, 0, 0)") == (0, 0, 0, 0)
+    assert _parse_color("red") is None
+    colors = _scale_colors(
+        np.array([0, 0.5, 1]), [(0, "#000000"), (1, "rgb(200, 100, 0)")]
+    )
+    assert colors == ["rgba(0,0,0,1)", "rgba(100,50,0,1)", "rgba(200,100,0,1)"]
+    # Colours that cannot be interpolated snap to the nearest stop.
+    assert _scale_colors(np.array([0.2, 0.9]), [(0, "red"), (1, "blue")]) == [
+        "red",
+        "blue",
+    ]
@@ -1,6 +1,15 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import plotly.graph_objects as go
 import pytest
 
-from soccer_viz import Pitch
+from soccer_viz import DefaultTheme, Pitch
+from soccer_viz._visualization import _heatmap_cache
+
+DATA_DIR = Path(__file__).parent / "data"
 
 
 class TestPitch:
@@ -77,3 +86,564 @@ class TestPitch:
             width=2,
             opacity=0.6,
         )
+
+
+def test_add_points() -> None:
+    pitch = Pitch()
+    pitch.add_points(
+        x=[10, 20, 30],
+        y=[5, 15, 25],
+        size=[10, 20, 30],
+        text=["A", "B", "C"],
+        number=[1, None, 3],
+        color="#123456",
+        opacity=[0.2, 0.5, 1.0],
+        symbol="square",
+    )
+    assert len(pitch.fig.data) == 2
+
+    trace, number_trace = pitch.fig.data
+    assert trace.x == (10, 20, 30)
+    assert trace.y == (5, 15, 25)
+    assert trace.marker.size == (10, 20, 30)
+    assert trace.marker.color == "#123456"
+    assert trace.marker.symbol == "square"
+    assert trace.marker.opacity == (0.2, 0.5, 1.0)
+    assert trace.text == ("A", "B", "C")
+    assert number_trace.text == ("1", "", "3")
+
+
+def test_add_points_copies_input() -> None:
+    pitch = Pitch(validate=False)
+    x = np.array([10.0, 20.0])
+    y = [5.0, 15.0]
+    pitch.add_points(x=x, y=y, size=np.int64(8), number=np.int64(7))
+    x[0] = 99
+    y[0] = 99
+    (points, numbers) = pitch.to_dict()["data"]
+    assert list(points["x"]) == [10, 20]
+    assert list(points["y"]) == [5, 15]
+    assert points["marker"]["size"] == 8
+    assert numbers["text"] == "7"
+
+    with pytest.raises(ValueError, match="Invalid x"):
+        pitch.add_points(x=np.zeros((2, 2)), y=[1, 2])
+
+
+def test_add_points_length_mismatch() -> None:
+    pitch = Pitch()
+    with pytest.raises(ValueError):
+        pitch.add_points(x=[10, 20], y=[5, 15], size=[10])
+
+
+def test_add_lines() -> None:
+    pitch = Pitch()
+    pitch.add_lines(
+        start_x=[0, 10, 20, 30],
+        start_y=[0, 10, 20, 30],
+        end_x=[5, 15, 25, 35],
+        end_y=[5, 15, 25, 35],
+        color=["#111111", "#222222", "#111111", "#111111"],
+        dash=["solid", "solid", "solid", "dot"],
+    )
+    solid, other, dotted = pitch.fig.data
+    assert solid.x == (0, 5, None, 20, 25)
+    assert solid.y == (0, 5, None, 20, 25)
+    assert solid.line.color == "#111111"
+    assert other.x == (10, 15)
+    assert other.line.color == "#222222"
+    assert dotted.line.dash == "dot"
+    assert dotted.line.width == 2
+
+
+def test_add_lines_invalid() -> None:
+    pitch = Pitch()
+    with pytest.raises(ValueError):
+        pitch.add_lines([0, 1], [0, 1], [0, 1], [0])
+    with pytest.raises(ValueError):
+        pitch.add_lines([0, 1], [0, 1], [0, 1], [0, 1], width=[1, 2, 3])
+
+
+def test_add_arrows() -> None:
+    pitch = Pitch(touch_line_range=(0, 100), goal_line_range=(0, 100))
+    pitch.add_arrows(
+        start_x=[0, 50, 10],
+        start_y=[0, 50, 10],
+        end_x=[20, 50, 10],
+        end_y=[0, 70, 10],
+        color=["#111111", "#111111", "#222222"],
+        head_length=2.1,
+        head_width=1.36,
+    )
+    shafts, _, heads, _ = pitch.fig.data
+    assert heads.fill == "toself"
+    assert heads.fillcolor == "#111111"
+    # Heads are sized in metres: one x unit is 1.05 m, one y unit 0.68 m.
+    assert shafts.x == pytest.approx((0, 18, None, 50, 50))
+    assert heads.x[:5] == pytest.approx((20, 18, 18, 20, None))
+    assert heads.y[:5] == pytest.approx((0, 1, -1, 0, None))
+    back = 70 - 2.1 / 0.68
+    side = 0.68 / 1.05
+    assert heads.x[5:] == pytest.approx((50, 50 - side, 50 + side, 50))
+    assert heads.y[5:] == pytest.approx((70, back, back, 70))
+    assert len(pitch.fig.layout.annotations) == 0
+
+
+def test_add_annotation_uses_data_axes() -> None:
+    pitch = Pitch()
+    pitch.add_annotation(start_x=10, start_y=20, end_x=30, end_y=40)
+    annotation = pitch.fig.layout.annotations[0]
+    assert (annotation.xref, annotation.yref) == ("x2", "y2")
+    assert (annotation.axref, annotation.ayref) == ("x2", "y2")
+
+
+def test_add_polygons() -> None:
+    pitch = Pitch()
+    square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+    triangle = np.array([(20, 20), (30, 20), (25, 30)])
+    pitch.add_polygons(
+        [square, triangle, square],
+        color=["#111111", "#111111", "#222222"],
+        opacity=0.5,
+    )
+    first, second = pitch.fig.data
+    assert first.x == (0, 10, 10, 0, 0, None, 20, 30, 25, 20)
+    assert first.y == (0, 0, 10, 10, 0, None, 20, 20, 30, 20)
+    assert first.fill == "toself"
+    assert first.fillcolor == "#111111"
+    assert first.opacity == 0.5
+    assert second.fillcolor == "#222222"
+
+    with pytest.raises(ValueError):
+        pitch.add_polygons([[(0, 0), (1, 1)]])
+
+
+def test_add_voronoi() -> None:
+    pitch = Pitch()
+    pitch.add_voronoi(
+        x=[20, 80, 200],
+        y=[30, 30, 30],
+        color=["#111111", "#222222", "#333333"],
+    )
+    home, away = pitch.fig.data
+    assert home.fillcolor == "#111111"
+    assert max(value for value in home.x if value is not None) == 50
+    assert away.fillcolor == "#222222"
+
+
+def test_add_surface() -> None:
+    pitch = Pitch()
+    pitch.add_surface(np.full((32, 50), 0.5))
+    (trace,) = pitch.fig.data
+    assert trace.type == "heatmap"
+    assert trace.x[0] == pytest.approx(1.05)
+    assert len(trace.x) == 50 and len(trace.y) == 32
+
+    pitch = Pitch(vertical=True)
+    pitch.add_surface(np.zeros((32, 50)))
+    (trace,) = pitch.fig.data
+    assert len(trace.x) == 32 and np.shape(trace.z) == (50, 32)
+
+    with pytest.raises(ValueError, match="Invalid z"):
+        pitch.add_surface(np.zeros(10))
+    with pytest.raises(ValueError, match="Invalid x, y"):
+        pitch.add_surface(np.zeros((2, 2)), x=[0, 1])
+
+
+def test_add_gradient_lines_share_traces() -> None:
+    pitch = Pitch()
+    for i in range(50):
+        pitch.add_line(
+            start_x=0, start_y=i, end_x=105, end_y=68 - i, gradient=True
+        )
+    assert len(pitch.fig.data) == 20
+
+    trace = pitch.fig.data[0]
+    assert len(trace.x) == 50 * 3 - 1
+    assert trace.x[2] is None
+
+
+def test_add_gradient_lines_keep_layer_order() -> None:
+    pitch = Pitch()
+    pitch.add_gradient_line(start_x=0, start_y=0, end_x=100, end_y=60)
+    pitch.add_point(x=50, y=30)
+    pitch.add_gradient_line(start_x=0, start_y=10, end_x=100, end_y=60)
+    modes = [trace["mode"] for trace in pitch.to_dict()["data"]]
+    assert modes == ["lines"] * 20 + ["markers+text"] + ["lines"] * 20
+
+
+def test_add_gradient_line_adaptive_steps() -> None:
+    pitch = Pitch()
+    pitch.add_gradient_line(start_x=10, start_y=10, end_x=11, end_y=10)
+    assert len(pitch.fig.data) == 2
+    assert pitch.fig.data[0].line.width == 1
+    assert pitch.fig.data[-1].line.width == 2.5
+
+
+def test_background_shapes_shared() -> None:
+    pitch1 = Pitch(side="left")
+    pitch2 = Pitch(side="left")
+    assert pitch1._background_shapes() is pitch2._background_shapes()
+    assert len(pitch1._background_shapes()) == 6
+
+    dark = Pitch(side="left", theme=DefaultTheme("dark"))
+    assert dark._background_shapes() is not pitch1._background_shapes()
+
+
+def test_show_is_idempotent(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(go.Figure, "show", lambda self: None)
+    pitch = Pitch()
+    pitch.add_point(x=10, y=20)
+    pitch.show()
+    pitch.show()
+    assert len(pitch.fig.data) == 1
+    assert len(pitch.fig.layout.shapes) == 14
+
+    pitch.add_line(start_x=10, start_y=20, end_x=30, end_y=40)
+    pitch.add_annotation(start_x=10, start_y=20, end_x=30, end_y=40)
+    pitch.show()
+    assert len(pitch.fig.data) == 2
+    assert len(pitch.fig.layout.shapes) == 14
+    assert len(pitch.fig.layout.annotations) == 1
+
+
+def test_show_applies_theme_change(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(go.Figure, "show", lambda self: None)
+    pitch = Pitch(side="left")
+    pitch.show()
+    pitch.theme = DefaultTheme("dark")
+    pitch.show(fig_length=500)
+    assert len(pitch.fig.layout.shapes) == 6
+    assert pitch.fig.layout.shapes[0].fillcolor == DefaultTheme.gray_900
+    assert pitch.fig.layout.paper_bgcolor == DefaultTheme.gray_900
+    assert pitch.fig.layout.width == 500
+
+
+def test_gradient_line_after_show(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(go.Figure, "show", lambda self: None)
+    pitch = Pitch()
+    pitch.add_gradient_line(start_x=0, start_y=0, end_x=100, end_y=60)
+    pitch.show()
+    pitch.add_gradient_line(start_x=0, start_y=10, end_x=100, end_y=60)
+    pitch.show()
+    assert len(pitch.fig.data) == 20
+    assert len(pitch.fig.data[0].x) == 5
+
+
+def test_image_data_uri_cached(tmp_path: Path) -> None:
+    crest = tmp_path / "crest.png"
+    crest.write_bytes((DATA_DIR / "arsenal.png").read_bytes())
+    copy = tmp_path / "copy.png"
+    copy.write_bytes(crest.read_bytes())
+
+    pitch = Pitch()
+    pitch.add_point(x=10, y=20, image_path=crest)
+    pitch.add_point(x=30, y=40, image_path=crest)
+    pitch.add_point(x=50, y=60, image_path=copy)
+    first, second, third = pitch._images
+    assert first["source"].startswith("data:image/png;base64,")
+    assert first["source"] is second["source"]
+    assert first["source"] is third["source"]
+
+    crest.write_bytes(b"changed")
+    os.utime(crest, ns=(0, 0))
+    pitch.add_point(x=70, y=20, image_path=crest)
+    assert pitch._images[-1]["source"] != first["source"]
+
+
+def _draw_layers(pitch: Pitch) -> None:
+    pitch.add_point(x=10, y=20, number=7, image_path=DATA_DIR / "arsenal.png")
+    pitch.add_points(x=[30, 40], y=[30, 40], text=["A", "B"])
+    pitch.add_line(start_x=10, start_y=20, end_x=30, end_y=40, gradient=True)
+    pitch.add_annotation(start_x=10, start_y=20, end_x=30, end_y=40)
+    pitch.add_triangle(a_x=0, a_y=0, b_x=10, b_y=0, c_x=5, c_y=5)
+    pitch.add_heatmap(x=[10, 20, 30], y=[10, 20, 30])
+
+
+def test_to_dict_without_validation() -> None:
+    fast = Pitch(validate=False)
+    _draw_layers(fast)
+    validated = Pitch()
+    _draw_layers(validated)
+    materialised = Pitch()
+    _draw_layers(materialised)
+    materialised.fig
+
+    fast_json = json.loads(fast.to_json())
+    assert fast_json == json.loads(validated.to_json())
+    assert fast_json == json.loads(materialised.to_json())
+    assert len(fast_json["data"]) == 24
+    assert len(fast_json["layout"]["shapes"]) == 14
+    assert fast._fig is None
+
+
+def test_to_dict_without_validation_is_a_copy() -> None:
+    pitch = Pitch(validate=False)
+    _draw_layers(pitch)
+    pitch.add_animation([[[1.0, 2.0]], [[3.0, 4.0]]])
+    expected = pitch.to_dict()
+
+    edited = pitch.to_dict()
+    edited["layout"]["shapes"][0]["line"]["color"] = "red"
+    edited["layout"]["template"]["data"]["scatter"][0]["marker"] = {}
+    edited["layout"]["updatemenus"][0]["buttons"].clear()
+    edited["data"][0]["marker"]["size"] = 1
+    edited["data"][1]["x"].append(99)
+    edited["layout"]["annotations"][0]["x"] = 99
+    edited["frames"][0]["data"][0]["x"][0] = 99
+
+    assert pitch.to_dict() == expected
+    fresh = Pitch(validate=False).to_dict()
+    assert fresh["layout"]["shapes"][0]["line"]["color"] != "red"
+    assert fresh["layout"]["template"]["data"]["scatter"][0]["marker"]
+
+
+def test_fig_template_is_a_copy() -> None:
+    pitch = Pitch()
+    color = pitch.fig.layout.template.data.scatter[0].marker.color
+    pitch.fig.layout.template.data.scatter[0].marker.color = "#00ff00"
+    pitch.fig.update_layout(template_layout_font_color="#00ff00")
+
+    fig = Pitch().fig
+    assert fig.layout.template.data.scatter[0].marker.color == color
+    assert fig.layout.template.layout.font.color != "#00ff00"
+    fresh = Pitch(validate=False).to_dict()["layout"]["template"]
+    assert fresh["data"]["scatter"][0]["marker"]["color"] == color
+
+
+def test_to_dict_keeps_figure_edits() -> None:
+    pitch = Pitch(validate=False)
+    pitch.add_point(x=10, y=20)
+    pitch.fig.update_layout(title="Shots")
+    assert pitch.to_dict()["layout"]["title"]["text"] == "Shots"
+
+
+def test_write_html(tmp_path: Path) -> None:
+    pitch = Pitch(validate=False)
+    pitch.add_point(x=10, y=20, text="Saka")
+    path = tmp_path / "pitch.html"
+    pitch.write_html(path)
+    html = path.read_text()
+    assert "Saka" in html
+    assert "cdn.plot.ly" in html
+
+
+def test_add_heatmap() -> None:
+    pitch = Pitch()
+    pitch.add_heatmap(
+        x=[1, 2, 104, 104], y=[1, 2, 67, 67], weights=[1, 1, 1, 2], bins=5
+    )
+    trace = pitch.fig.data[0]
+    assert trace.type == "heatmap"
+    assert trace.xaxis == "x2"
+    assert len(trace.x) == 5
+    assert trace.z[0][0] == 2
+    assert trace.z[-1][-1] == 3
+    assert sum(sum(row) for row in trace.z) == 5
+
+
+def test_add_heatmap_default_bins() -> None:
+    pitch = Pitch(validate=False)
+    pitch.add_heatmap(x=[10], y=[10])
+    vertical = Pitch(validate=False, vertical=True)
+    vertical.add_heatmap(x=[10], y=[10])
+    assert (len(pitch._traces[0]["x"]), len(pitch._traces[0]["y"])) == (21, 14)
+    trace = vertical._traces[0]
+    assert (len(trace["x"]), len(trace["y"])) == (14, 21)
+
+
+def test_add_heatmap_reuses_bins() -> None:
+    _heatmap_cache.clear()
+    x = np.linspace(0, 105, 1000)
+    y = np.linspace(0, 68, 1000)
+    light = Pitch(validate=False)
+    light.add_heatmap(x, y)
+    dark = Pitch(validate=False, theme=DefaultTheme("dark"))
+    dark.add_heatmap(x.copy(), y.copy())
+    assert light._traces[0]["z"] == dark._traces[0]["z"]
+    assert len(_heatmap_cache) == 1
+
+
+def test_add_animation() -> None:
+    positions = np.zeros((100, 3, 2))
+    positions[:, :, 0] = np.arange(100)[:, None]
+    pitch = Pitch()
+    pitch.add_point(x=10, y=20)
+    pitch.add_animation(
+        positions, color=["red", "red", "white"], step=2, max_frames=20
+    )
+    fig = pitch.to_dict()
+    assert len(fig["data"]) == 2
+    assert len(fig["frames"]) == 20
+    assert fig["frames"][1]["traces"] == [1]
+    assert fig["frames"][1]["data"][0]["x"] == [5.0, 5.0, 5.0]
+
+    steps = fig["layout"]["sliders"][0]["steps"]
+    assert len(steps) == 20
+    assert steps[0]["label"] == "00:00.0"
+    assert steps[-1]["label"] == "00:03.8"
+
+    with pytest.raises(ValueError):
+        pitch.add_animation(positions)
+
+
+def test_add_animation_redraws_webgl() -> None:
+    def redraws(pitch: Pitch) -> set[bool]:
+        layout = pitch.to_dict()["layout"]
+        items = [*layout["updatemenus"][0]["buttons"]]
+        items += layout["sliders"][0]["steps"]
+        return {item["args"][1]["frame"]["redraw"] for item in items}
+
+    positions = np.zeros((3, 2, 2))
+    svg = Pitch(validate=False, render="svg")
+    svg.add_animation(positions)
+    assert redraws(svg) == {False}
+    webgl = Pitch(validate=False, render="webgl")
+    webgl.add_animation(positions)
+    assert redraws(webgl) == {True}
+
+
+def test_add_animation_with_figure_traces() -> None:
+    pitch = Pitch()
+    pitch.fig.add_trace(go.Scatter(x=[0], y=[0]))
+    pitch.add_animation(np.zeros((3, 2, 2)), size=np.int64(8))
+    fig = pitch.fig
+    assert fig.data[1].marker.size == 8
+    assert fig.frames[0].traces == (1,)
+
+
+def test_add_animation_invalid_shape() -> None:
+    pitch = Pitch()
+    with pytest.raises(ValueError):
+        pitch.add_animation(np.zeros((10, 3)))
+
+
+def test_render_webgl() -> None:
+    pitch = Pitch(render="webgl")
+    pitch.add_point(x=10, y=20)
+    pitch.add_heatmap(x=[10], y=[20])
+    assert [trace.type for trace in pitch.fig.data] == [
+        "scattergl",
+        "heatmap",
+    ]
+    assert pitch.fig.data[0].xaxis == "x2"
+
+
+def test_render_auto_switches_to_webgl() -> None:
+    pitch = Pitch(webgl_threshold=100)
+    pitch.add_point(x=10, y=20)
+    assert pitch.fig.data[0].type == "scatter"
+
+    pitch.add_points(x=np.arange(100), y=np.arange(100))
+    assert [trace.type for trace in pitch.fig.data] == [
+        "scattergl",
+        "scattergl",
+    ]
+    assert pitch.to_dict()["data"][0]["type"] == "scattergl"
+
+    svg = Pitch(render="svg", webgl_threshold=100)
+    svg.add_points(x=np.arange(200), y=np.arange(200))
+    assert svg.to_dict()["data"][0]["type"] == "scatter"
+
+
+def test_render_auto_keeps_figure_traces() -> None:
+    pitch = Pitch(webgl_threshold=100)
+    pitch.add_point(x=10, y=20)
+    pitch.fig.add_trace(go.Bar(x=[1], y=[2], name="user"))
+    pitch.add_line(start_x=0, start_y=0, end_x=50, end_y=50, gradient=True)
+    pitch.fig
+
+    pitch.add_line(start_x=0, start_y=50, end_x=50, end_y=0, gradient=True)
+    pitch.add_points(x=np.arange(100), y=np.arange(100))
+    data = pitch.fig.data
+    assert data[1].name == "user"
+    assert data[1].type == "bar"
+    assert {trace.type for trace in data[:1] + data[2:]} == {"scattergl"}
+    # Gradient segments added before the switch reach the right traces.
+    assert len(data[2].x) == len(pitch._traces[1]["x"]) > 2
+
+
+def test_stats() -> None:
+    pitch = Pitch()
+    _draw_layers(pitch)
+    stats = pitch.stats()
+    assert stats["traces"] == 24
+    assert stats["shapes"] == 14
+    assert stats["annotations"] == 1
+    assert stats["images"] == 1
+    assert stats["image_bytes"] == len(pitch._images[0]["source"])
+    assert stats["payload_bytes"] is None
+    assert stats["timings"] == {}
+    assert "add_point" not in vars(pitch)
+
+
+def test_stats_instrumented(tmp_path: Path) -> None:
+    metrics: list[tuple[str, float]] = []
+    pitch = Pitch(instrument=True)
+    pitch.add_hook(lambda name, value: metrics.append((name, value)))
+    pitch.add_point(x=10, y=20)
+    pitch.add_point(x=30, y=40)
+    payload = pitch.to_json()
+
+    stats = pitch.stats()
+    assert stats["points"] == 2
+    assert stats["timings"]["add_point"]["calls"] == 2
+    assert stats["timings"]["to_json"]["calls"] == 1
+    assert stats["timings"]["_validated_dict"]["calls"] == 1
+    assert stats["payload_bytes"] == len(payload.encode())
+    assert [name for name, _ in metrics][:2] == ["add_point", "add_point"]
+    assert ("payload_bytes", len(payload.encode())) in metrics
+
+    path = tmp_path / "pitch.html"
+    pitch.write_html(path)
+    assert pitch.stats()["payload_bytes"] == path.stat().st_size
+
+
+def test_theme_template(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(go.Figure, "show", lambda self: None)
+    pitch = Pitch(validate=False)
+    pitch.add_point(x=10, y=20, text="A")
+    pitch.add_line(start_x=10, start_y=20, end_x=30, end_y=40)
+    fig_dict = pitch.to_dict()
+    point, line = fig_dict["data"]
+    assert "textfont" not in point
+    assert "color" not in point["marker"]
+    assert "color" not in line["line"]
+    (scatter,) = fig_dict["layout"]["template"]["data"]["scatter"]
+    assert scatter["textfont"]["color"] == pitch.theme.text
+    assert scatter["marker"]["color"] == pitch.theme.home_team
+    assert scatter["line"]["color"] == pitch.theme.line
+
+    pitch.show()
+    pitch.theme = DefaultTheme("dark")
+    pitch.show()
+    template = pitch.fig.layout.template
+    assert template.data.scatter[0].marker.color == pitch.theme.home_team
+
+
+def test_fig_has_theme_template() -> None:
+    pitch = Pitch()
+    pitch.add_point(x=10, y=20, text="A")
+    template = pitch.fig.layout.template
+    assert template.data.scatter[0].marker.color == pitch.theme.home_team
+    assert template.data.scatter[0].textfont.color == pitch.theme.text
+
+    pitch.theme = DefaultTheme("dark")
+    template = pitch.fig.layout.template
+    assert template.data.scatter[0].marker.color == pitch.theme.home_team
+
+
+def test_precision() -> None:
+    pitch = Pitch(validate=False, precision=1)
+    pitch.add_points(x=np.array([10.123, 20.987]), y=[1.04, 2.96])
+    pitch.add_line(start_x=1 / 3, start_y=2 / 3, end_x=1, end_y=2)
+    pitch.add_annotation(start_x=1 / 3, start_y=2 / 3, end_x=1, end_y=2)
+    fig_dict = pitch.to_dict()
+    points, line = fig_dict["data"]
+    assert points["x"].tolist() == [10.1, 21.0]
+    assert points["y"] == [1.0, 3.0]
+    assert line["x"] == [0.3, 1]
+    annotation = fig_dict["layout"]["annotations"][0]
+    assert (annotation["ax"], annotation["ay"]) == (0.3, 0.7)
+    assert pitch._traces[1]["x"] == [1 / 3, 1]
+    assert pitch.fig.data[1].x == (0.3, 1)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from soccer_viz._voronoi import voronoi_frames
+
+BOUNDS = (0.0, 0.0, 105.0, 68.0)
+
+
+def _area(cell: NDArray[np.float64]) -> float:
+    x, y = cell[:, 0], cell[:, 1]
+    return float(abs(x @ np.roll(y, 1) - y @ np.roll(x, 1)) / 2)
+
+
+def test_voronoi_frames_tile_the_pitch() -> None:
+    positions = np.random.default_rng(0).uniform(
+        (0, 0), (105, 68), (20, 22, 2)
+    )
+    frames = voronoi_frames(positions, BOUNDS, batch_size=7)
+    assert len(frames) == 20
+    for cells, sites in zip(frames, positions):
+        assert sum(_area(cell) for cell in cells) == pytest.approx(105 * 68)
+        for cell, site in zip(cells, sites):
+            # Every vertex is at least as close to its own site as to any
+            # other.
+            d = np.linalg.norm(cell[:, None] - sites[None], axis=2)
+            own = np.linalg.norm(cell - site, axis=1)
+            assert np.all(own <= d.min(axis=1) + 1e-6)
+
+
+def test_voronoi_frames_grid() -> None:
+    sites = [(x, y) for x in (17.5, 52.5, 87.5) for y in (17, 51)]
+    (cells,) = voronoi_frames([sites], BOUNDS)
+    assert [len(cell) for cell in cells] == [4] * 6
+    np.testing.assert_allclose(
+        cells[0], [(0, 0), (35, 0), (35, 34), (0, 34)], atol=1e-9
+    )
+
+
+def test_voronoi_frames_missing_and_repeated() -> None:
+    frame = [(20.0, 30.0), (80.0, 30.0), (np.nan, np.nan)]
+    first, second = voronoi_frames([frame, frame], BOUNDS)
+    assert first is second
+    assert _area(first[0]) == pytest.approx(50 * 68)
+    assert first[2].shape == (0, 2)
+
+
+def test_voronoi_frames_workers() -> None:
+    positions = np.random.default_rng(1).uniform((0, 0), (105, 68), (8, 5, 2))
+    serial = voronoi_frames(positions, BOUNDS, batch_size=2)
+    parallel = voronoi_frames(positions, BOUNDS, batch_size=2, workers=2)
+    for a, b in zip(serial, parallel):
+        for x, y in zip(a, b):
+            np.testing.assert_array_equal(x, y)
+
+
+def test_voronoi_frames_invalid() -> None:
+    with pytest.raises(ValueError):
+        voronoi_frames(np.zeros((3, 2)), BOUNDS)
+    with pytest.raises(ValueError):
+        voronoi_frames(np.zeros((1, 3, 2)), BOUNDS, workers=0)